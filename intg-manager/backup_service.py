@@ -15,14 +15,32 @@ The backup flow:
 :license: Mozilla Public License Version 2.0, see LICENSE for more details.
 """
 
+import asyncio
+import base64
+import hashlib
 import json
 import logging
 import os
+import re
+import threading
 import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Any
 
-from const import MANAGER_DATA_FILE, API_DELAY, Settings
+import orjson
+
+from const import (
+    MANAGER_DATA_FILE,
+    API_DELAY,
+    BACKUP_CONCURRENCY,
+    BACKUP_REQUEST_BURST,
+    BACKUP_REQUEST_RATE,
+    Settings,
+    atomic_write_json,
+)
+from remote_api import RemoteAPIClient, RemoteAPIError
 from sync_api import SyncRemoteClient, SyncAPIError
 
 _LOG = logging.getLogger(__name__)
@@ -30,31 +48,61 @@ _LOG = logging.getLogger(__name__)
 # Backup storage file
 BACKUP_FILE = MANAGER_DATA_FILE
 
+# Backup data of at least this many bytes is stored zlib-compressed
+COMPRESS_MIN_SIZE = 1024
+
+# Escape sequences undone when backup data is not valid JSON as-is
+_ESCAPE_RE = re.compile(r'\\([n"\\])')
+_ESCAPES = {"n": "\n", '"': '"', "\\": "\\"}
+
+# Serializes read-modify-write cycles on the backup file across worker threads
+_BACKUPS_LOCK = threading.Lock()
+
+# Raw backup file content keyed by (st_mtime_ns, st_size) of the file it was read from
+_BACKUPS_CACHE: tuple[tuple[int, int], bytes] | None = None
+
 
 def _load_backups() -> dict[str, Any]:
-    """Load the backup data from disk."""
+    """
+    Load the backup data from disk.
+
+    The raw file content is cached until its modification time or size
+    changes. It is parsed on every call, which is much cheaper than deep
+    copying a parsed cache, so callers are free to mutate the result.
+    """
+    global _BACKUPS_CACHE
+
     if os.path.exists(BACKUP_FILE):
         try:
-            with open(BACKUP_FILE, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                # Migrate old format to new format if needed
-                if "backups" in data and "integrations" not in data:
-                    _LOG.info("Migrating backup file to new format")
-                    return {
-                        "settings": data.get("settings", {}),
-                        "integrations": data.get("backups", {}),
-                        "backup_timestamp": data.get("last_updated"),
-                        "version": "1.0",
-                    }
-                # Ensure all required keys exist
-                if "integrations" not in data:
-                    data["integrations"] = {}
-                if "settings" not in data:
-                    data["settings"] = {}
-                if "version" not in data:
-                    data["version"] = "1.0"
-                return data
-        except (json.JSONDecodeError, OSError) as e:
+            stat = os.stat(BACKUP_FILE)
+            cache_key = (stat.st_mtime_ns, stat.st_size)
+            cached = _BACKUPS_CACHE
+            if cached is not None and cached[0] == cache_key:
+                raw = cached[1]
+            else:
+                with open(BACKUP_FILE, "rb") as f:
+                    raw = f.read()
+                _BACKUPS_CACHE = (cache_key, raw)
+
+            data = orjson.loads(raw)
+            # Migrate old format to new format if needed
+            if "backups" in data and "integrations" not in data:
+                _LOG.info("Migrating backup file to new format")
+                data = {
+                    "settings": data.get("settings", {}),
+                    "integrations": data.get("backups", {}),
+                    "backup_timestamp": data.get("last_updated"),
+                    "version": "1.0",
+                }
+            # Ensure all required keys exist
+            if "integrations" not in data:
+                data["integrations"] = {}
+            if "settings" not in data:
+                data["settings"] = {}
+            if "version" not in data:
+                data["version"] = "1.0"
+            return data
+        except (orjson.JSONDecodeError, OSError) as e:
             _LOG.error("Failed to load backups file: %s", e)
     return {
         "settings": {},
@@ -64,19 +112,308 @@ def _load_backups() -> dict[str, Any]:
     }
 
 
+def _read_backup_data(driver_id: str) -> str | None:
+    """
+    Stream the backup data of a single integration from the backup file.
+
+    Parsing stops as soon as the entry has been read, so the rest of the
+    file is never decoded.
+
+    :param driver_id: The driver ID
+    :return: The backup data string or None if not found
+    """
+    # ijson prefixes are dot-separated, so such IDs cannot be addressed
+    if "." in driver_id:
+        return None
+
+    # Imported on first use: probing the ijson backends is slow at startup
+    import ijson  # pylint: disable=import-outside-toplevel
+
+    try:
+        with open(BACKUP_FILE, "rb") as f:
+            for entry in ijson.items(f, f"integrations.{driver_id}", use_float=True):
+                return _decode_backup_entry(entry) if entry else None
+    except FileNotFoundError:
+        pass
+    except (ijson.JSONError, OSError) as e:
+        _LOG.warning("Failed to stream backup for %s: %s", driver_id, e)
+    return None
+
+
 def _save_backups(data: dict[str, Any]) -> bool:
     """Save the backup data to disk."""
+    global _BACKUPS_CACHE
+
+    _BACKUPS_CACHE = None
     try:
         data["backup_timestamp"] = datetime.now().isoformat()
         data["version"] = "1.0"
-        with open(BACKUP_FILE, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2)
+        atomic_write_json(BACKUP_FILE, data)
         return True
     except OSError as e:
         _LOG.error("Failed to save backups file: %s", e)
         return False
 
 
+def _make_backup_entry(backup_data: str) -> dict[str, Any]:
+    """
+    Build a stored backup entry from raw backup data.
+
+    Cleaned data of COMPRESS_MIN_SIZE bytes or more is stored as base64
+    encoded zlib data under "data_zlib". Smaller JSON objects and arrays are
+    stored as native JSON under "data_json", so they are not escaped into a
+    string inside the backup file, unless orjson (which writes the backup
+    file) would change them. Anything else is kept as a plain "data" string.
+
+    :param backup_data: The raw backup data string
+    :return: Entry with the cleaned data, its SHA-256 digest and a timestamp
+    """
+    clean_data, parsed_data = _clean_backup_data(backup_data)
+    encoded = clean_data.encode("utf-8")
+    entry: dict[str, Any] = {}
+    if len(encoded) >= COMPRESS_MIN_SIZE:
+        entry["data_zlib"] = base64.b64encode(zlib.compress(encoded)).decode("ascii")
+    elif isinstance(parsed_data, (dict, list)) and _fits_orjson(parsed_data):
+        entry["data_json"] = parsed_data
+    else:
+        entry["data"] = clean_data
+    entry["sha256"] = hashlib.sha256(encoded).hexdigest()
+    entry["timestamp"] = datetime.now().isoformat()
+    return entry
+
+
+def _fits_orjson(parsed_data: Any) -> bool:
+    """
+    Check that parsed backup data survives a round trip through orjson.
+
+    orjson only handles 64-bit integers and no NaN or Infinity, while backup
+    data is an opaque integration payload parsed with the stdlib json module.
+
+    :param parsed_data: The parsed backup data
+    :return: True if the data can be stored natively in the backup file
+    """
+    try:
+        return orjson.loads(orjson.dumps(parsed_data)) == parsed_data
+    except orjson.JSONEncodeError:
+        return False
+
+
+def _decode_backup_entry(entry: dict[str, Any]) -> str | None:
+    """
+    Get the backup data string of a stored entry.
+
+    Handles plain ("data"), native JSON ("data_json") and compressed
+    ("data_zlib") entries.
+
+    :param entry: The stored backup entry
+    :return: The backup data string or None if missing or undecodable
+    """
+    if "data_json" in entry:
+        return _format_backup_data(entry["data_json"])
+    if "data_zlib" not in entry:
+        return entry.get("data")
+    try:
+        return zlib.decompress(base64.b64decode(entry["data_zlib"])).decode("utf-8")
+    except (ValueError, zlib.error) as e:
+        _LOG.error("Failed to decompress backup data: %s", e)
+        return None
+
+
+def _is_unchanged(stored: dict[str, Any] | None, entry: dict[str, Any]) -> bool:
+    """
+    Check whether a new backup entry has the same content as the stored one.
+
+    :param stored: The currently stored entry (None if there is none)
+    :param entry: The new entry (see _make_backup_entry())
+    :return: True if the stored entry already holds this content
+    """
+    return stored is not None and stored.get("sha256") == entry["sha256"]
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket pacing requests to the remote.
+
+    Requests pass immediately while tokens are available and are spaced out
+    at the current rate once the burst is used up. The rate is halved when
+    the remote reports an error and recovers additively on success (AIMD).
+    """
+
+    def __init__(self, rate: float, burst: int, min_rate: float = 0.1) -> None:
+        """
+        Initialize the bucket.
+
+        :param rate: Maximum sustained rate in tokens per second
+        :param burst: Maximum number of tokens that can be spent at once
+        :param min_rate: Lower bound for the rate after backoffs
+        """
+        self._max_rate = rate
+        self._min_rate = min_rate
+        self._rate = rate
+        self._burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    @property
+    def rate(self) -> float:
+        """Current rate in tokens per second."""
+        return self._rate
+
+    def _reserve(self) -> float:
+        """
+        Take a token, going into debt if none is available.
+
+        :return: Seconds the caller has to wait before using the token
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self._burst, self._tokens + (now - self._updated) * self._rate
+            )
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self._rate
+
+    def acquire(self, min_delay: float = 0.0) -> None:
+        """
+        Block until a token is available.
+
+        :param min_delay: Seconds to wait even if a token is available
+        """
+        delay = max(min_delay, self._reserve())
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self, min_delay: float = 0.0) -> None:
+        """
+        Wait on the event loop until a token is available.
+
+        :param min_delay: Seconds to wait even if a token is available
+        """
+        delay = max(min_delay, self._reserve())
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def backoff(self) -> None:
+        """Halve the rate after the remote reported an error."""
+        with self._lock:
+            self._rate = max(self._min_rate, self._rate / 2)
+            self._tokens = min(self._tokens, 0.0)
+
+    def recover(self) -> None:
+        """Raise the rate again after a successful request sequence."""
+        with self._lock:
+            self._rate = min(self._max_rate, self._rate + self._max_rate / 10)
+
+
+# Paces setup flow requests of all backups, across threads and coroutines
+_REQUEST_BUCKET = TokenBucket(BACKUP_REQUEST_RATE, BACKUP_REQUEST_BURST)
+
+
+class BackupStore:
+    """
+    In-memory batch of integration backups.
+
+    Entries are collected in memory while a batch of backups runs and are
+    written to the backup file with a single flush() at the end, instead of
+    re-reading and re-writing the whole file for every integration.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty backup batch."""
+        self._entries: dict[str, dict[str, Any]] = {}
+        self._settings: dict[str, Any] | None = None
+        self._lock = threading.Lock()
+
+    def set(self, driver_id: str, backup_data: str) -> None:
+        """
+        Add (or replace) the backup entry for an integration.
+
+        :param driver_id: The driver ID
+        :param backup_data: The raw backup data string
+        """
+        entry = _make_backup_entry(backup_data)
+        with self._lock:
+            self._entries[driver_id] = entry
+
+    def set_settings(self, settings: dict[str, Any]) -> None:
+        """
+        Include the manager settings in the batch.
+
+        :param settings: Settings dictionary (see Settings.to_dict())
+        """
+        with self._lock:
+            self._settings = settings
+
+    def flush(self) -> bool:
+        """
+        Write all collected entries to the backup file.
+
+        The file is re-read under the backup lock first so sections written
+        by others since the batch started are preserved. Entries whose
+        content is unchanged since the stored backup are skipped, and the
+        file is not rewritten at all if nothing changed.
+
+        :return: True if saved successfully (or there was nothing to save)
+        """
+        with self._lock:
+            entries = dict(self._entries)
+            settings = self._settings
+            self._entries.clear()
+            self._settings = None
+
+        with _BACKUPS_LOCK:
+            backups = _load_backups()
+            stored = backups["integrations"]
+            entries = {
+                driver_id: entry
+                for driver_id, entry in entries.items()
+                if not _is_unchanged(stored.get(driver_id), entry)
+            }
+            if settings == backups["settings"]:
+                settings = None
+
+            if not entries and settings is None:
+                _LOG.debug("Backups unchanged, skipping write")
+                return True
+
+            stored.update(entries)
+            if settings is not None:
+                backups["settings"] = settings
+            success = _save_backups(backups)
+
+        if success:
+            _LOG.info("Saved %d integration backup(s) to file", len(entries))
+        else:
+            _LOG.error("Failed to save %d integration backup(s)", len(entries))
+        return success
+
+
+def _settings_by_id(setup_response: dict[str, Any]) -> dict[str, dict[str, Any]]:
+    """
+    Index the input settings of a setup response by their ID.
+
+    The response structure has:
+    require_user_action.input.settings[] where each setting has an "id".
+    If several settings share an ID, the first one wins.
+
+    :param setup_response: A setup flow response
+    :return: Dictionary of setting ID -> setting
+    """
+    settings = (
+        setup_response.get("require_user_action", {})
+        .get("input", {})
+        .get("settings", [])
+    )
+    by_id: dict[str, dict[str, Any]] = {}
+    for setting in settings:
+        by_id.setdefault(setting.get("id"), setting)
+    return by_id
+
+
 def _extract_first_choice_id(setup_response: dict[str, Any]) -> str | None:
     """
     Extract the first dropdown choice ID from a setup response.
@@ -88,16 +425,10 @@ def _extract_first_choice_id(setup_response: dict[str, Any]) -> str | None:
     :return: The choice ID or None if not found
     """
     try:
-        settings = (
-            setup_response.get("require_user_action", {})
-            .get("input", {})
-            .get("settings", [])
-        )
-        for setting in settings:
-            if setting.get("id") == "choice":
-                dropdown = setting.get("field", {}).get("dropdown", {})
-                return dropdown.get("value")
-        return None
+        setting = _settings_by_id(setup_response).get("choice")
+        if setting is None:
+            return None
+        return setting.get("field", {}).get("dropdown", {}).get("value")
     except (KeyError, TypeError, IndexError) as e:
         _LOG.warning("Failed to extract choice ID: %s", e)
         return None
@@ -115,25 +446,101 @@ def _extract_backup_data(setup_response: dict[str, Any]) -> str | None:
     :return: The backup data string or None if not found
     """
     try:
-        settings = (
-            setup_response.get("require_user_action", {})
-            .get("input", {})
-            .get("settings", [])
-        )
-        for setting in settings:
-            if setting.get("id") == "backup_data":
-                textarea = setting.get("field", {}).get("textarea", {})
-                return textarea.get("value")
-        return None
+        setting = _settings_by_id(setup_response).get("backup_data")
+        if setting is None:
+            return None
+        return setting.get("field", {}).get("textarea", {}).get("value")
     except (KeyError, TypeError) as e:
         _LOG.warning("Failed to extract backup data: %s", e)
         return None
 
 
+def _check_setup_response(response: Any, request: str, driver_id: str) -> bool:
+    """
+    Check that a setup flow request returned a response.
+
+    :param response: The response of the request
+    :param request: Description of the request for logging
+    :param driver_id: The driver ID being backed up
+    :return: True if there is a response
+    """
+    if not response:
+        _LOG.error("No response from %s for %s", request, driver_id)
+        return False
+    _LOG.debug("Response from %s for %s: %s", request, driver_id, response)
+    return True
+
+
+def _backup_input_values(
+    driver_id: str, setup_response: dict[str, Any]
+) -> dict[str, str] | None:
+    """
+    Build the setup input that requests a backup.
+
+    :param driver_id: The driver ID being backed up
+    :param setup_response: The setup page with the choices
+    :return: The input values, or None if the integration offers no choice
+    """
+    choice_id = _extract_first_choice_id(setup_response)
+    if not choice_id:
+        _LOG.warning(
+            "No choice ID found in setup response for %s. "
+            "Integration may not support backup.",
+            driver_id,
+        )
+        return None
+
+    _LOG.debug("Found choice ID: %s", choice_id)
+    return {
+        "choice": choice_id,
+        "action": "backup",
+        "backup_data": "[]",  # Empty initial value
+    }
+
+
+def _backup_data_from(driver_id: str, setup_response: dict[str, Any]) -> str | None:
+    """
+    Get the backup data from the setup page shown after the backup action.
+
+    :param driver_id: The driver ID being backed up
+    :param setup_response: The setup page with the backup data
+    :return: The backup data string, or None if not found
+    """
+    backup_data = _extract_backup_data(setup_response)
+    if not backup_data:
+        _LOG.warning("No backup data found in response for %s", driver_id)
+        return None
+    _LOG.info("Successfully extracted backup data for %s", driver_id)
+    return backup_data
+
+
+def _store_backup(
+    driver_id: str, backup_data: str, save_to_file: bool, store: BackupStore | None
+) -> None:
+    """
+    Keep the extracted backup data.
+
+    :param driver_id: The driver ID
+    :param backup_data: The backup data string
+    :param save_to_file: Whether to save to the backup file
+    :param store: Batch to add the backup to instead of writing it to file
+    """
+    if store is not None:
+        store.set(driver_id, backup_data)
+    elif save_to_file:
+        if save_backup(driver_id, backup_data):
+            _LOG.info("Backup for '%s' completed successfully", driver_id)
+        else:
+            _LOG.warning(
+                "Backup for '%s' extracted but failed to save to file", driver_id
+            )
+
+
 def backup_integration(
     client: SyncRemoteClient,
     driver_id: str,
     save_to_file: bool = True,
+    store: BackupStore | None = None,
 ) -> str | None:
     """
     Backup an integration's configuration.
@@ -147,6 +554,7 @@ def backup_integration(
     :param client: The SyncRemoteClient instance
     :param driver_id: The driver ID to backup
     :param save_to_file: Whether to save to integration_backups.json
+    :param store: Batch to add the backup to instead of writing it to file
     :return: The backup data string, or None if backup failed
     """
     _LOG.info("Starting backup for integration: %s", driver_id)
@@ -154,157 +562,220 @@ def backup_integration(
     try:
         # Step 1: Start the setup flow (this just initiates setup mode)
         start_response = client.start_setup(driver_id, reconfigure=True)
-        if not start_response:
-            _LOG.error("No response from start_setup for %s", driver_id)
+        if not _check_setup_response(start_response, "start_setup", driver_id):
             return None
 
-        _LOG.debug("Start setup response: %s", start_response)
-
-        # Brief pause before next request
-        time.sleep(API_DELAY)
+        # Give the integration time to produce its setup page
+        _REQUEST_BUCKET.acquire(API_DELAY)
 
         # Step 2: Get the setup page with choices
         setup_response = client.get_setup(driver_id)
-        if not setup_response:
-            _LOG.error("No response from get_setup for %s", driver_id)
+        if not _check_setup_response(setup_response, "get_setup", driver_id):
             return None
 
-        _LOG.debug("Get setup response: %s", setup_response)
-
-        # Brief pause before next request
-        time.sleep(API_DELAY)
+        # Paces the backup action or the cancel request below
+        _REQUEST_BUCKET.acquire(API_DELAY)
 
         # Step 3: Extract the first choice ID
-        choice_id = _extract_first_choice_id(setup_response)
-        if not choice_id:
-            _LOG.warning(
-                "No choice ID found in setup response for %s. "
-                "Integration may not support backup.",
-                driver_id,
-            )
+        input_values = _backup_input_values(driver_id, setup_response)
+        if input_values is None:
             # Try to cancel the setup flow
             client.complete_setup(driver_id)
             return None
 
-        _LOG.debug("Found choice ID: %s", choice_id)
-
         # Step 4: Send the backup action
-        input_values = {
-            "choice": choice_id,
-            "action": "backup",
-            "backup_data": "[]",  # Empty initial value
-        }
         backup_response = client.send_setup_input(driver_id, input_values)
-        if not backup_response:
-            _LOG.error("No response from backup request for %s", driver_id)
+        if not _check_setup_response(backup_response, "backup request", driver_id):
             client.complete_setup(driver_id)
             return None
 
-        _LOG.debug("Backup PUT response: %s", backup_response)
-
-        # Brief pause before next request
-        time.sleep(API_DELAY * 2)
+        # Give the integration time to produce the backup data
+        _REQUEST_BUCKET.acquire(API_DELAY * 2)
 
         # Step 5: Get the updated setup page with backup data
         setup_response = client.get_setup(driver_id)
-        if not setup_response:
-            _LOG.error("No response from get_setup after backup for %s", driver_id)
+        if not _check_setup_response(
+            setup_response, "get_setup after backup", driver_id
+        ):
             client.complete_setup(driver_id)
             return None
 
-        _LOG.debug("Get setup response (with backup data): %s", setup_response)
-
-        # Brief pause before next request
-        time.sleep(API_DELAY * 2)
+        _REQUEST_BUCKET.acquire(API_DELAY)
 
         # Step 6: Extract the backup data
-        backup_data = _extract_backup_data(setup_response)
-        if not backup_data:
-            _LOG.warning("No backup data found in response for %s", driver_id)
-            client.complete_setup(driver_id)
-            return None
-
-        _LOG.info("Successfully extracted backup data for %s", driver_id)
+        backup_data = _backup_data_from(driver_id, setup_response)
 
         # Complete the setup flow (we're done)
         client.complete_setup(driver_id)
         _LOG.debug("Completed setup flow for %s", driver_id)
+        if backup_data is None:
+            return None
+        _REQUEST_BUCKET.recover()
 
-        # Brief pause after completing setup
-        time.sleep(API_DELAY)
-
-        # Save to file if requested
-        if save_to_file:
-            if save_backup(driver_id, backup_data):
-                _LOG.info("Backup for '%s' completed successfully", driver_id)
-            else:
-                _LOG.warning(
-                    "Backup for '%s' extracted but failed to save to file", driver_id
-                )
-
+        _store_backup(driver_id, backup_data, save_to_file, store)
         return backup_data
 
     except SyncAPIError as e:
         _LOG.error("API error during backup of %s: %s", driver_id, e)
+        _REQUEST_BUCKET.backoff()
         try:
+            _REQUEST_BUCKET.acquire()
             client.complete_setup(driver_id)
-            time.sleep(API_DELAY)  # Brief pause after cleanup
         except SyncAPIError:
             pass
         return None
 
 
-def _clean_backup_data(raw_data: str) -> str:
+async def backup_integration_async(
+    client: RemoteAPIClient,
+    driver_id: str,
+    save_to_file: bool = True,
+    store: BackupStore | None = None,
+) -> str | None:
+    """
+    Backup an integration's configuration using the async Remote API client.
+
+    Same flow as backup_integration(), but the requests and the pacing delays
+    are awaited so several backups can share one event loop.
+
+    :param client: The RemoteAPIClient instance
+    :param driver_id: The driver ID to backup
+    :param save_to_file: Whether to save to integration_backups.json
+    :param store: Batch to add the backup to instead of writing it to file
+    :return: The backup data string, or None if backup failed
+    """
+    _LOG.info("Starting backup for integration: %s", driver_id)
+
+    try:
+        # Step 1: Start the setup flow (this just initiates setup mode)
+        start_response = await client.start_setup(driver_id, reconfigure=True)
+        if not _check_setup_response(start_response, "start_setup", driver_id):
+            return None
+
+        # Give the integration time to produce its setup page
+        await _REQUEST_BUCKET.acquire_async(API_DELAY)
+
+        # Step 2: Get the setup page with choices
+        setup_response = await client.get_setup(driver_id)
+        if not _check_setup_response(setup_response, "get_setup", driver_id):
+            return None
+
+        # Paces the backup action or the cancel request below
+        await _REQUEST_BUCKET.acquire_async(API_DELAY)
+
+        # Step 3: Extract the first choice ID
+        input_values = _backup_input_values(driver_id, setup_response)
+        if input_values is None:
+            await client.complete_setup(driver_id)
+            return None
+
+        # Step 4: Send the backup action
+        backup_response = await client.send_setup_input(driver_id, input_values)
+        if not _check_setup_response(backup_response, "backup request", driver_id):
+            await client.complete_setup(driver_id)
+            return None
+
+        # Give the integration time to produce the backup data
+        await _REQUEST_BUCKET.acquire_async(API_DELAY * 2)
+
+        # Step 5: Get the updated setup page with backup data
+        setup_response = await client.get_setup(driver_id)
+        if not _check_setup_response(
+            setup_response, "get_setup after backup", driver_id
+        ):
+            await client.complete_setup(driver_id)
+            return None
+
+        await _REQUEST_BUCKET.acquire_async(API_DELAY)
+
+        # Step 6: Extract the backup data
+        backup_data = _backup_data_from(driver_id, setup_response)
+
+        # Complete the setup flow (we're done)
+        await client.complete_setup(driver_id)
+        _LOG.debug("Completed setup flow for %s", driver_id)
+        if backup_data is None:
+            return None
+        _REQUEST_BUCKET.recover()
+
+        _store_backup(driver_id, backup_data, save_to_file, store)
+        return backup_data
+
+    except RemoteAPIError as e:
+        _LOG.error("API error during backup of %s: %s", driver_id, e)
+        _REQUEST_BUCKET.backoff()
+        try:
+            await _REQUEST_BUCKET.acquire_async()
+            await client.complete_setup(driver_id)
+        except RemoteAPIError:
+            pass
+        return None
+
+
+def _clean_backup_data(raw_data: str) -> tuple[str, Any]:
     """
     Clean backup data by parsing and reformatting JSON.
 
     Removes escape characters and control data, ensuring clean JSON output.
+    Data that is already valid, multi-line JSON is returned unchanged.
 
     :param raw_data: Raw backup data string (potentially with escape chars)
-    :return: Clean, formatted JSON string
+    :return: Clean, formatted JSON string and the parsed data (None if the
+        data could not be parsed and the raw string is returned)
     """
     try:
-        # First, try to parse as JSON in case it's already escaped
+        # First, try to parse as JSON in case it's already escaped. The stdlib
+        # parser keeps integers beyond 64 bits exact, unlike orjson
         parsed_data = json.loads(raw_data)
+        # Already formatted JSON needs no re-serialization
+        if isinstance(parsed_data, (dict, list)) and "\n" in raw_data:
+            return raw_data, parsed_data
         # Re-serialize with clean formatting
-        return json.dumps(parsed_data, indent=2, ensure_ascii=False)
+        return _format_backup_data(parsed_data), parsed_data
     except json.JSONDecodeError:
         try:
-            # If that fails, try to decode escape sequences manually
-            # Handle common escape sequences
-            cleaned = (
-                raw_data.replace("\\n", "\n").replace('\\"', '"').replace("\\\\", "\\")
-            )
+            # If that fails, decode the common escape sequences in one pass
+            cleaned = _ESCAPE_RE.sub(lambda m: _ESCAPES[m.group(1)], raw_data)
             # Try to parse again
             parsed_data = json.loads(cleaned)
-            return json.dumps(parsed_data, indent=2, ensure_ascii=False)
+            return _format_backup_data(parsed_data), parsed_data
         except json.JSONDecodeError:
             # If all else fails, return the original data
             _LOG.warning("Could not parse backup data as JSON, saving raw data")
-            return raw_data
+            return raw_data, None
+
+
+def _format_backup_data(parsed_data: Any) -> str:
+    """Serialize parsed backup data to the indented string form."""
+    return json.dumps(parsed_data, indent=2, ensure_ascii=False)
 
 
 def save_backup(driver_id: str, backup_data: str) -> bool:
     """
     Save backup data for an integration to the backups file.
 
+    If the stored backup already has identical content, the file is left
+    untouched (and the stored timestamp is kept).
+
     :param driver_id: The driver ID
     :param backup_data: The raw backup data string
     :return: True if saved successfully
     """
     # Clean the backup data before saving
-    clean_data = _clean_backup_data(backup_data)
-
-    backups = _load_backups()
-    timestamp = datetime.now().isoformat()
-    backups["integrations"][driver_id] = {
-        "data": clean_data,
-        "timestamp": timestamp,
-    }
-    success = _save_backups(backups)
+    entry = _make_backup_entry(backup_data)
+
+    with _BACKUPS_LOCK:
+        backups = _load_backups()
+        if _is_unchanged(backups["integrations"].get(driver_id), entry):
+            _LOG.info("Backup for integration '%s' is unchanged", driver_id)
+            return True
+        backups["integrations"][driver_id] = entry
+        success = _save_backups(backups)
     if success:
         _LOG.info(
-            "Successfully saved backup for integration '%s' at %s", driver_id, timestamp
+            "Successfully saved backup for integration '%s' at %s",
+            driver_id,
+            entry["timestamp"],
         )
     else:
         _LOG.error("Failed to save backup for integration '%s'", driver_id)
@@ -315,13 +786,21 @@ def get_backup(driver_id: str) -> str | None:
     """
     Get the stored backup data for an integration.
 
+    While the backup file has not been loaded yet, only the requested entry
+    is streamed from disk instead of parsing the whole file.
+
     :param driver_id: The driver ID
     :return: The backup data string or None if not found
     """
+    if _BACKUPS_CACHE is None:
+        backup_data = _read_backup_data(driver_id)
+        if backup_data is not None:
+            return backup_data
+
     backups = _load_backups()
     backup_entry = backups.get("integrations", {}).get(driver_id)
     if backup_entry:
-        return backup_entry.get("data")
+        return _decode_backup_entry(backup_entry)
     return None
 
 
@@ -329,9 +808,18 @@ def get_all_backups() -> dict[str, Any]:
     """
     Get all stored backups.
 
+    Compressed and native JSON entries are returned decoded, so every
+    integration entry carries its backup data as a string under "data".
+
     :return: Dictionary with backup data keyed by driver_id
     """
-    return _load_backups()
+    backups = _load_backups()
+    for entry in backups["integrations"].values():
+        if "data_zlib" in entry or "data_json" in entry:
+            entry["data"] = _decode_backup_entry(entry)
+            entry.pop("data_zlib", None)
+            entry.pop("data_json", None)
+    return backups
 
 
 def delete_backup(driver_id: str) -> bool:
@@ -341,19 +829,55 @@ def delete_backup(driver_id: str) -> bool:
     :param driver_id: The driver ID
     :return: True if deleted (or didn't exist)
     """
-    backups = _load_backups()
-    if driver_id in backups.get("integrations", {}):
-        del backups["integrations"][driver_id]
-        return _save_backups(backups)
+    with _BACKUPS_LOCK:
+        backups = _load_backups()
+        if driver_id in backups.get("integrations", {}):
+            del backups["integrations"][driver_id]
+            return _save_backups(backups)
     return True
 
 
+def backup_integrations(
+    client: SyncRemoteClient,
+    driver_ids: list[str],
+    store: BackupStore | None = None,
+) -> dict[str, str | None]:
+    """
+    Extract backup data for several integrations in one batch.
+
+    The Remote API has no bulk backup endpoint, so each integration still
+    runs its own setup flow; the flows are spread over a small worker pool
+    (BACKUP_CONCURRENCY) and nothing is written to disk. Successful backups
+    are added to ``store`` if given, to be persisted with one flush().
+
+    :param client: The SyncRemoteClient instance
+    :param driver_ids: The driver IDs to backup
+    :param store: Batch to collect the backups in
+    :return: Dictionary of driver_id -> backup data (None if backup failed)
+    """
+    if not driver_ids:
+        return {}
+
+    def _backup(driver_id: str) -> str | None:
+        _LOG.info("Backing up integration: %s", driver_id)
+        return backup_integration(client, driver_id, save_to_file=False, store=store)
+
+    with ThreadPoolExecutor(
+        max_workers=min(BACKUP_CONCURRENCY, len(driver_ids)),
+        thread_name_prefix="backup",
+    ) as executor:
+        return dict(zip(driver_ids, executor.map(_backup, driver_ids)))
+
+
 def backup_all_integrations(
     client: SyncRemoteClient, include_settings: bool = True
 ) -> dict[str, bool]:
     """
     Backup all installed custom integrations and optionally settings.
 
+    All backups of the run are collected in a BackupStore and written to
+    the backup file once at the end.
+
     :param client: The SyncRemoteClient instance
     :param include_settings: Whether to include settings in the backup
     :return: Dictionary of driver_id -> success boolean
@@ -364,33 +888,59 @@ def backup_all_integrations(
         # Get all drivers
         drivers = client.get_drivers()
 
-        for driver in drivers:
-            driver_id = driver.get("driver_id")
-            driver_type = driver.get("driver_type", "")
-
-            # Only backup CUSTOM integrations (installed on remote)
-            if driver_type != "CUSTOM":
-                continue
-
-            if not driver_id:
-                continue
-
-            _LOG.info("Backing up integration: %s", driver_id)
-            backup_data = backup_integration(client, driver_id, save_to_file=True)
+        # Only backup CUSTOM integrations (installed on remote)
+        driver_ids = [
+            driver["driver_id"]
+            for driver in drivers
+            if driver.get("driver_type") == "CUSTOM" and driver.get("driver_id")
+        ]
+        _LOG.info("Backing up %d custom integration(s)", len(driver_ids))
+
+        store = BackupStore()
+        for driver_id, backup_data in backup_integrations(
+            client, driver_ids, store=store
+        ).items():
             results[driver_id] = backup_data is not None
 
-            # Pause between integrations to avoid overwhelming the remote
-            time.sleep(API_DELAY * 2)
-
         # Save settings to backup file if requested
         if include_settings:
-            settings = Settings.load()
-            backups = _load_backups()
-            backups["settings"] = settings.to_dict()
-            _save_backups(backups)
+            store.set_settings(Settings.load().to_dict())
+
+        if not store.flush():
+            results = dict.fromkeys(results, False)
+        elif include_settings:
             _LOG.info("Saved settings to backup file")
 
     except SyncAPIError as e:
         _LOG.error("Failed to get drivers for backup: %s", e)
 
     return results
+
+
+async def backup_integrations_async(
+    client: RemoteAPIClient,
+    driver_ids: list[str],
+    store: BackupStore | None = None,
+) -> dict[str, str | None]:
+    """
+    Extract backup data for several integrations using the async client.
+
+    Same as backup_integrations(), but the setup flows run as coroutines on
+    the caller's event loop, with at most BACKUP_CONCURRENCY in flight.
+
+    :param client: The RemoteAPIClient instance
+    :param driver_ids: The driver IDs to backup
+    :param store: Batch to collect the backups in
+    :return: Dictionary of driver_id -> backup data (None if backup failed)
+    """
+    semaphore = asyncio.Semaphore(BACKUP_CONCURRENCY)
+
+    async def _backup(driver_id: str) -> str | None:
+        async with semaphore:
+            _LOG.info("Backing up integration: %s", driver_id)
+            return await backup_integration_async(
+                client, driver_id, save_to_file=False, store=store
+            )
+
+    outcomes = await asyncio.gather(*(_backup(driver_id) for driver_id in driver_ids))
+    return dict(zip(driver_ids, outcomes))
@@ -3,24 +3,28 @@
 :license: Mozilla Public License Version 2.0, see LICENSE for more details.
 """
 
-import json
 import logging
 import os
+import tempfile
+import time
 from dataclasses import dataclass, asdict, fields
 from typing import Any
 
+import orjson
+
 _LOG = logging.getLogger(__name__)
 
 
 # Configuration directory for persistent storage
-# Use UC_CONFIG_HOME environment variable (Docker/Remote), fall back to ./config for local dev
+# Priority: UC_CONFIG_HOME > UC_DATA_HOME (Docker/Remote) > ./config for local dev
 def _get_data_dir():
     """Get the data directory, with fallback for local development."""
-    # Check for UC_CONFIG_HOME environment variable (set by Docker/Remote)
-    config_home = os.environ.get("UC_CONFIG_HOME")
-    if config_home:
-        os.makedirs(config_home, exist_ok=True)
-        return config_home
+    # Check the environment variables set by Docker/Remote
+    for env_var in ("UC_CONFIG_HOME", "UC_DATA_HOME"):
+        config_home = os.environ.get(env_var)
+        if config_home:
+            os.makedirs(config_home, exist_ok=True)
+            return config_home
 
     # Fall back to relative ./config directory for local development
     local_config_dir = os.path.join(
@@ -49,14 +53,81 @@ API_DELAY = (
     0.75  # seconds - delay between API requests to avoid overwhelming the remote
 )
 
+# Maximum number of integrations backed up concurrently
+BACKUP_CONCURRENCY = 3
+
+# Backup request pacing: sustained requests per second and burst size
+BACKUP_REQUEST_RATE = 1.5
+BACKUP_REQUEST_BURST = 4
+
+# Seconds a loaded Settings instance is reused before the file is checked again
+SETTINGS_CACHE_TTL = 5.0
+
+# orjson options for data files: compact unless pretty output is requested for debugging
+JSON_WRITE_OPTIONS = orjson.OPT_INDENT_2 if os.environ.get("UC_PRETTY_JSON") else 0
+
+
+def atomic_write_json(path: str, data: Any) -> None:
+    """
+    Write JSON data to a file atomically.
+
+    The data is written to a temporary file in the same directory, flushed to
+    disk and then renamed over the target, so a crash mid-write leaves either
+    the old or the new content in place, never a truncated file.
+
+    :param path: Target file path
+    :param data: JSON-serializable data
+    :raises OSError: If the file could not be written
+    """
+    directory = os.path.dirname(path) or "."
+    fd, tmp_path = tempfile.mkstemp(
+        prefix=f".{os.path.basename(path)}.", suffix=".tmp", dir=directory
+    )
+    try:
+        with os.fdopen(fd, "wb") as f:
+            # mkstemp creates the file owner-only; keep the target's permissions
+            try:
+                mode = os.stat(path).st_mode & 0o777
+            except FileNotFoundError:
+                mode = 0o644
+            os.chmod(tmp_path, mode)
+
+            f.write(orjson.dumps(data, option=JSON_WRITE_OPTIONS))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+    # Persist the rename itself (POSIX only)
+    if hasattr(os, "O_DIRECTORY"):
+        try:
+            dir_fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+        except OSError:
+            return
+        try:
+            os.fsync(dir_fd)
+        except OSError:
+            pass
+        finally:
+            os.close(dir_fd)
+
+
+# Settings section of MANAGER_DATA_FILE as (checked_at, (st_mtime_ns, st_size), data)
+_settings_cache: tuple[float, tuple[int, int], dict[str, Any]] | None = None
 
-@dataclass
+
+@dataclass(slots=True)
 class Settings:
     """
     User settings for the Integration Manager.
 
     These settings control the behavior of the integration manager
-    and are persisted to settings.json.
+    and are persisted to the settings section of MANAGER_DATA_FILE.
     """
 
     shutdown_on_battery: bool = True
@@ -79,18 +150,36 @@ class Settings:
 
     @classmethod
     def load(cls) -> "Settings":
-        """Load settings from manager data file or return defaults."""
+        """
+        Load settings from manager data file or return defaults.
+
+        The settings section is only re-read when the file's modification
+        time or size has changed since the previous load, and the file is
+        not checked at all for SETTINGS_CACHE_TTL seconds after a load.
+        """
+        global _settings_cache
+
+        field_names = {f.name for f in fields(cls)}
+        cached = _settings_cache
+        if cached is not None and time.monotonic() - cached[0] < SETTINGS_CACHE_TTL:
+            return cls(**{k: v for k, v in cached[2].items() if k in field_names})
+
         if os.path.exists(MANAGER_DATA_FILE):
             try:
-                with open(MANAGER_DATA_FILE, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                settings_data = data.get("settings", {})
-                field_names = {f.name for f in fields(cls)}
-                _LOG.info("Loaded settings from %s", MANAGER_DATA_FILE)
+                stat = os.stat(MANAGER_DATA_FILE)
+                cache_key = (stat.st_mtime_ns, stat.st_size)
+                if cached is not None and cached[1] == cache_key:
+                    settings_data = cached[2]
+                else:
+                    with open(MANAGER_DATA_FILE, "rb") as f:
+                        data = orjson.loads(f.read())
+                    settings_data = data.get("settings", {})
+                    _LOG.info("Loaded settings from %s", MANAGER_DATA_FILE)
+                _settings_cache = (time.monotonic(), cache_key, settings_data)
                 return cls(
                     **{k: v for k, v in settings_data.items() if k in field_names}
                 )
-            except (json.JSONDecodeError, OSError) as e:
+            except (orjson.JSONDecodeError, OSError) as e:
                 _LOG.warning(
                     "Failed to load settings from %s: %s", MANAGER_DATA_FILE, e
                 )
@@ -102,6 +191,8 @@ class Settings:
 
     def save(self) -> None:
         """Save settings to manager data file."""
+        global _settings_cache
+
         try:
             os.makedirs(os.path.dirname(MANAGER_DATA_FILE), exist_ok=True)
 
@@ -109,27 +200,29 @@ class Settings:
             existing_data = {}
             if os.path.exists(MANAGER_DATA_FILE):
                 try:
-                    with open(MANAGER_DATA_FILE, "r", encoding="utf-8") as f:
-                        existing_data = json.load(f)
-                except (json.JSONDecodeError, OSError):
+                    with open(MANAGER_DATA_FILE, "rb") as f:
+                        existing_data = orjson.loads(f.read())
+                except (orjson.JSONDecodeError, OSError):
                     pass
 
             # Update settings section
             existing_data["settings"] = asdict(self)
             existing_data["version"] = "1.0"
 
-            with open(MANAGER_DATA_FILE, "w", encoding="utf-8") as f:
-                json.dump(existing_data, f, indent=2)
+            atomic_write_json(MANAGER_DATA_FILE, existing_data)
             _LOG.info("Settings saved to %s", MANAGER_DATA_FILE)
         except OSError as e:
             _LOG.error("Failed to save settings: %s", e)
+        finally:
+            # Cleared after the write, a load during it could cache the old data
+            _settings_cache = None
 
     def to_dict(self) -> dict[str, Any]:
         """Convert settings to dictionary."""
         return asdict(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class RemoteConfig:
     """
     Remote configuration dataclass.
@@ -171,6 +264,9 @@ WEB_SERVER_PORT = int(os.environ.get("UC_INTG_MANAGER_HTTP_PORT", "8088"))
 KNOWN_INTEGRATIONS_URL = "https://raw.githubusercontent.com/JackJPowell/uc-intg-list/refs/heads/main/registry.json"
 # KNOWN_INTEGRATIONS_URL = os.path.join(os.path.dirname(__file__), "registry.json")
 
+# Seconds a downloaded registry is used before it is revalidated
+KNOWN_INTEGRATIONS_CACHE_TTL = 900
+
 # Polling interval in seconds for checking remote power status
 POWER_POLL_INTERVAL = 30
 
@@ -7,13 +7,15 @@ It manages connections, polls power status, and controls the web server.
 :license: Mozilla Public License Version 2.0, see LICENSE for more details.
 """
 
+import asyncio
 import logging
 import os
 from asyncio import AbstractEventLoop
-from datetime import datetime
+from datetime import date, datetime, time, timedelta
 from typing import Any
 
 from const import (
+    MANAGER_DATA_FILE,
     RemoteConfig,
     Settings,
     POWER_POLL_INTERVAL,
@@ -25,13 +27,32 @@ from ucapi_framework import BaseConfigManager, PollingDevice
 
 _LOG = logging.getLogger(__name__)
 
+# Remote events that may indicate a change of the charging state
+DOCK_EVENTS = frozenset({"battery_status", "power_mode_change"})
+
+
+def _next_occurrence(time_str: str, now: datetime) -> datetime:
+    """
+    Get the next occurrence of a time of day.
+
+    :param time_str: Time string in "HH:MM" format
+    :param now: The current local time
+    :return: That time today, or tomorrow if it has already passed
+    :raises ValueError: If the time string is invalid
+    """
+    hour, minute = map(int, time_str.split(":"))
+    target = datetime.combine(now.date(), time(hour, minute))
+    if target <= now:
+        target += timedelta(days=1)
+    return target
+
 
 class IntegrationManagerDevice(PollingDevice):
     """
     Device class representing the connection to the Unfolded Circle Remote.
 
     This class handles:
-    - Polling the remote for power/dock status
+    - Tracking the remote's power/dock status (event driven, polling fallback)
     - Starting/stopping the web server based on dock status
     - Managing the remote API connection
     """
@@ -58,14 +79,20 @@ class IntegrationManagerDevice(PollingDevice):
 
         self._device_config: RemoteConfig = device_config
 
-        # Load user settings
-        self._settings = Settings.load()
+        # Load user settings (reloaded when the settings file changes)
+        self._settings_mtime_ns: int = -1
+        self._backup_enabled: bool = False
+        self._settings: Settings = self._get_settings()
+
+        # Credentials, None when not configured
+        self._pin: str | None = device_config.pin or None
+        self._api_key: str | None = device_config.api_key or None
 
         # Initialize the Remote API client
         self._client = RemoteAPIClient(
             address=device_config.address,
-            pin=device_config.pin if device_config.pin else None,
-            api_key=device_config.api_key if device_config.api_key else None,
+            pin=self._pin,
+            api_key=self._api_key,
         )
 
         # Web server instance
@@ -78,11 +105,26 @@ class IntegrationManagerDevice(PollingDevice):
         # Track if we're running in external/Docker mode
         self._is_external: bool = False
 
+        # Dock state change notifications from the remote's event stream
+        self._dock_event = asyncio.Event()
+        # Polls and dock events update the dock state one at a time
+        self._dock_lock = asyncio.Lock()
+        self._events_connected: bool = False
+        self._event_tasks: list[asyncio.Task] = []
+
         # Poll counter for periodic version checking
         self._poll_count: int = 0
+        # Periodic integration checks running in the background
+        self._version_task: asyncio.Task | None = None
+
+        # Local time the next scheduled backup is due and the settings it was
+        # set up for
+        self._backup_due: datetime | None = None
+        self._backup_schedule: tuple[bool, str] | None = None
+        self._backup_task: asyncio.Task | None = None
 
-        # Last backup date for scheduling
-        self._last_backup_date: str | None = None
+        # Date ordinal of the last successful scheduled backup
+        self._last_backup_ordinal: int = -1
 
     # =========================================================================
     # Properties
@@ -113,6 +155,27 @@ class IntegrationManagerDevice(PollingDevice):
         """Return whether the remote is currently docked."""
         return self._is_docked
 
+    # =========================================================================
+    # Settings
+    # =========================================================================
+
+    def _get_settings(self) -> Settings:
+        """
+        Get the user settings.
+
+        The settings are only loaded again when the modification time of the
+        settings file has changed, which also refreshes the backup flag.
+        """
+        try:
+            mtime_ns = os.stat(MANAGER_DATA_FILE).st_mtime_ns
+        except OSError:
+            mtime_ns = 0
+        if mtime_ns != self._settings_mtime_ns:
+            self._settings = Settings.load()
+            self._settings_mtime_ns = mtime_ns
+            self._backup_enabled = self._settings.backup_configs
+        return self._settings
+
     # =========================================================================
     # Connection Management
     # =========================================================================
@@ -168,6 +231,8 @@ class IntegrationManagerDevice(PollingDevice):
                             self.log_id,
                             e,
                         )
+
+                    self._start_event_listener()
             else:
                 raise RemoteAPIError("Connection test failed")
 
@@ -180,6 +245,12 @@ class IntegrationManagerDevice(PollingDevice):
         """Disconnect from the remote."""
         _LOG.debug("[%s] Disconnecting from remote", self.log_id)
 
+        self._stop_event_listener()
+        self._cancel_scheduled_backup()
+        for task in (self._version_task, self._backup_task):
+            if task and not task.done():
+                task.cancel()
+
         # Stop web server if running
         if self._web_server and self._web_server.is_running:
             self._web_server.stop()
@@ -225,6 +296,8 @@ class IntegrationManagerDevice(PollingDevice):
         the web server accordingly. Also triggers periodic version checks for
         installed integrations.
 
+        Charging status is only polled while the remote's event stream is not
+        connected; otherwise dock changes are handled as they are reported.
         When running in external/Docker mode, skip charging status checks since
         the web server should always be running.
         """
@@ -232,35 +305,104 @@ class IntegrationManagerDevice(PollingDevice):
 
         try:
             # Skip dock polling in external/Docker mode - web server always runs
-            if not self._is_external:
-                was_docked = self._is_docked
-                self._is_docked = await self._client.is_docked()
-
-                # Handle dock state changes
-                if self._is_docked and not was_docked:
-                    # Remote just docked - start web server
-                    await self._on_docked()
-                elif not self._is_docked and was_docked:
-                    # Remote just undocked - stop web server
-                    await self._on_undocked()
+            if not self._is_external and not self._events_connected:
+                await self._update_dock_state()
 
             # Periodic version check (every VERSION_CHECK_INTERVAL_POLLS polls)
-            # Only check when docked and web server is running
+            # Only check when docked and web server is running, and never run
+            # two checks at once; the poll itself doesn't wait for the check
             if (
                 self._is_docked
                 and self._web_server
                 and self._web_server.is_running
                 and self._poll_count % VERSION_CHECK_INTERVAL_POLLS == 0
+                and (self._version_task is None or self._version_task.done())
             ):
-                await self._check_integration_versions()
+                self._version_task = asyncio.create_task(
+                    self._check_integration_versions()
+                )
 
-            # Periodic backup check - only when docked and web server is running
-            if self._is_docked and self._web_server and self._web_server.is_running:
-                await self._check_scheduled_backup()
+            # Pick up changes to the backup schedule and start the backup once
+            # it is due, nothing to do while backups stay disabled
+            settings = self._get_settings()
+            if self._backup_enabled:
+                self._schedule_backup(settings)
+            elif self._backup_schedule is not None:
+                self._cancel_scheduled_backup()
 
         except RemoteAPIError as e:
             _LOG.warning("[%s] Failed to poll power status: %s", self.log_id, e)
 
+    async def _update_dock_state(self) -> None:
+        """
+        Query the charging status and handle dock state changes.
+
+        Serialized with _dock_lock, so a poll and a dock event running at the
+        same time never handle the same change twice.
+
+        :raises RemoteAPIError: If the status request fails
+        """
+        async with self._dock_lock:
+            was_docked = self._is_docked
+            self._is_docked = await self._client.is_docked()
+
+            # Handle dock state changes
+            if self._is_docked and not was_docked:
+                # Remote just docked - start web server
+                await self._on_docked()
+            elif not self._is_docked and was_docked:
+                # Remote just undocked - stop web server
+                await self._on_undocked()
+
+    def _start_event_listener(self) -> None:
+        """Start listening for dock state changes pushed by the remote."""
+        if self._event_tasks:
+            return
+        self._event_tasks = [
+            asyncio.create_task(self._listen_dock_events()),
+            asyncio.create_task(self._handle_dock_events()),
+        ]
+
+    def _stop_event_listener(self) -> None:
+        """Stop listening for dock state changes."""
+        for task in self._event_tasks:
+            task.cancel()
+        self._event_tasks = []
+        self._events_connected = False
+
+    async def _listen_dock_events(self) -> None:
+        """
+        Signal dock related events from the remote's event stream.
+
+        While the stream is down, poll_device() falls back to polling the
+        charging status; reconnects are attempted every POWER_POLL_INTERVAL.
+        """
+        while True:
+            try:
+                async for event in self._client.listen_events():
+                    if not self._events_connected:
+                        self._events_connected = True
+                        _LOG.info("[%s] Listening for dock events", self.log_id)
+                        # Catch up on changes missed while disconnected
+                        self._dock_event.set()
+                    if event.get("msg") in DOCK_EVENTS:
+                        self._dock_event.set()
+            except RemoteAPIError as e:
+                _LOG.debug("[%s] Event stream unavailable: %s", self.log_id, e)
+            self._events_connected = False
+            await asyncio.sleep(POWER_POLL_INTERVAL)
+
+    async def _handle_dock_events(self) -> None:
+        """Update the dock state whenever dock events were signalled."""
+        while True:
+            await self._dock_event.wait()
+            # A burst of events results in a single status request
+            self._dock_event.clear()
+            try:
+                await self._update_dock_state()
+            except RemoteAPIError as e:
+                _LOG.warning("[%s] Failed to update dock state: %s", self.log_id, e)
+
     async def _on_docked(self) -> None:
         """Handle remote being docked/charging - start web server."""
         _LOG.info("[%s] Remote charging started - starting web server", self.log_id)
@@ -269,10 +411,8 @@ class IntegrationManagerDevice(PollingDevice):
             if self._web_server is None:
                 self._web_server = WebServer(
                     address=self._device_config.address,
-                    pin=self._device_config.pin if self._device_config.pin else None,
-                    api_key=self._device_config.api_key
-                    if self._device_config.api_key
-                    else None,
+                    pin=self._pin,
+                    api_key=self._api_key,
                 )
 
             if not self._web_server.is_running:
@@ -280,8 +420,6 @@ class IntegrationManagerDevice(PollingDevice):
 
                 # Give the server thread a moment to start and verify it didn't fail
                 # The server sets _running = True immediately, but actual startup happens in background
-                import asyncio
-
                 await asyncio.sleep(0.5)
 
                 if self._web_server.is_running:
@@ -328,7 +466,7 @@ class IntegrationManagerDevice(PollingDevice):
 
     async def _on_undocked(self) -> None:
         """Handle remote being undocked/unplugged - conditionally stop web server."""
-        if not self._settings.shutdown_on_battery:
+        if not self._get_settings().shutdown_on_battery:
             _LOG.info(
                 "[%s] Remote on battery - web server remains running (shutdown_on_battery=False)",
                 self.log_id,
@@ -346,111 +484,143 @@ class IntegrationManagerDevice(PollingDevice):
         Check for updates to installed integrations.
 
         This is called periodically during polling to refresh version info.
-        The web server caches this data for display in the UI.
+        The web server caches this data for display in the UI. The checks use
+        blocking HTTP clients, so they run in a worker thread.
         """
         if not self._web_server:
             return
 
         _LOG.info("[%s] Checking for integration updates...", self.log_id)
         try:
-            # Trigger the web server to refresh version data
-            # This updates the cached update availability info and sends update notifications
-            self._web_server.refresh_integration_versions()
-
-            # Check for error states (disconnected, error, etc.)
-            self._web_server.check_error_states()
-
-            # Check for new integrations in registry
-            self._web_server.check_new_integrations()
-
-            # Check for orphaned entities in activities
-            self._web_server.check_orphaned_entities()
-
-            # Check for new system messages from GitHub
-            self._web_server.check_system_messages()
-
+            await asyncio.to_thread(self._run_integration_checks, self._web_server)
             _LOG.debug("[%s] Integration checks complete", self.log_id)
         except Exception as e:
             _LOG.warning("[%s] Failed to check integrations: %s", self.log_id, e)
 
-    def _is_backup_time(self, backup_time_str: str) -> bool:
+    @staticmethod
+    def _run_integration_checks(web_server: WebServer) -> None:
         """
-        Check if the current time matches the scheduled backup time.
+        Run the periodic integration checks of the web server.
 
-        :param backup_time_str: Time string in "HH:MM" format
-        :return: True if it's time to backup
+        :param web_server: The running web server
         """
+        # Trigger the web server to refresh version data
+        # This updates the cached update availability info and sends update notifications
+        web_server.refresh_integration_versions()
 
-        try:
-            now = datetime.now()
-            current_date = now.strftime("%Y-%m-%d")
+        # Check for error states (disconnected, error, etc.)
+        web_server.check_error_states()
 
-            # Check if we already backed up today
-            if self._last_backup_date == current_date:
-                return False
+        # Check for new integrations in registry
+        web_server.check_new_integrations()
 
-            # Parse the backup time
-            backup_hour, backup_minute = map(int, backup_time_str.split(":"))
+        # Check for orphaned entities in activities
+        web_server.check_orphaned_entities()
 
-            # Check if current time matches (within the polling window)
-            current_hour = now.hour
-            current_minute = now.minute
+        # Check for new system messages from GitHub
+        web_server.check_system_messages()
 
-            # Allow a 5-minute window around the scheduled time
-            if backup_hour == current_hour:
-                time_diff = abs(current_minute - backup_minute)
-                return time_diff <= 5
+    def _schedule_backup(self, settings: Settings) -> None:
+        """
+        Track the next scheduled backup and start it once it is due.
 
-            return False
-        except (ValueError, AttributeError) as e:
-            _LOG.warning(
-                "[%s] Invalid backup time format '%s': %s",
-                self.log_id,
-                backup_time_str,
-                e,
-            )
-            return False
+        The due time is kept as local wall-clock time and checked on every
+        poll, so it is met after the remote was suspended and across daylight
+        saving changes, which a long event loop timer would miss.
 
-    async def _check_scheduled_backup(self) -> None:
+        :param settings: Current user settings
         """
-        Check if it's time for scheduled backup and perform if needed.
+        now = datetime.now()
+        schedule = (settings.backup_configs, settings.backup_time)
+        if schedule != self._backup_schedule:
+            self._backup_schedule = schedule
+            self._backup_due = None
+            if not settings.backup_configs:
+                return  # Automatic backups disabled
 
-        This is called during each poll cycle when docked and web server is running.
-        """
-        if not self._web_server:
+            try:
+                self._backup_due = _next_occurrence(settings.backup_time, now)
+            except ValueError as e:
+                _LOG.warning(
+                    "[%s] Invalid backup time format '%s': %s",
+                    self.log_id,
+                    settings.backup_time,
+                    e,
+                )
+                return
+            _LOG.debug(
+                "[%s] Next scheduled backup at %s",
+                self.log_id,
+                self._backup_due.isoformat(timespec="minutes"),
+            )
+
+        if (
+            self._backup_due is None
+            or now < self._backup_due
+            or (self._backup_task is not None and not self._backup_task.done())
+        ):
             return
 
-        try:
-            # Load current settings to check if backups are enabled
-            settings = Settings.load()
+        # Stays due until the backup ran, so a skipped or failed backup is
+        # retried on the next poll
+        self._backup_task = self._loop.create_task(self._run_scheduled_backup())
 
-            if not settings.backup_configs:
-                return  # Automatic backups disabled
+    def _cancel_scheduled_backup(self) -> None:
+        """Forget the next scheduled backup, if any."""
+        self._backup_due = None
+        self._backup_schedule = None
 
-            if not self._is_backup_time(settings.backup_time):
-                return  # Not backup time yet
+    async def _run_scheduled_backup(self) -> None:
+        """
+        Perform the scheduled backup.
 
-            _LOG.info(
-                "[%s] Starting scheduled backup at %s",
-                self.log_id,
-                settings.backup_time,
-            )
+        The backup only runs when docked and the web server is running, and
+        at most once a day (e.g. when the backup time is moved after a run).
+        The next backup is only scheduled once today's backup has run.
+        """
+        try:
+            if self._last_backup_ordinal == date.today().toordinal():
+                _LOG.debug("[%s] Scheduled backup already ran today", self.log_id)
+                self._schedule_next_backup()
+            elif self._is_docked and self._web_server and self._web_server.is_running:
+                _LOG.info(
+                    "[%s] Starting scheduled backup at %s",
+                    self.log_id,
+                    self._backup_schedule[1] if self._backup_schedule else "",
+                )
 
-            # Perform the backup via web server (run in executor since it's sync)
-            backup_result = await self._loop.run_in_executor(
-                None, self._web_server.perform_scheduled_backup
-            )
+                # Perform the backup via web server on the event loop
+                backup_result = await self._web_server.perform_scheduled_backup_async(
+                    self._client
+                )
 
-            # Update last backup date on success
-            if backup_result:
-                self._last_backup_date = datetime.now().strftime("%Y-%m-%d")
-                _LOG.info("[%s] Scheduled backup completed successfully", self.log_id)
+                if backup_result:
+                    self._last_backup_ordinal = date.today().toordinal()
+                    self._schedule_next_backup()
+                    _LOG.info(
+                        "[%s] Scheduled backup completed successfully", self.log_id
+                    )
+                else:
+                    _LOG.warning("[%s] Scheduled backup failed", self.log_id)
             else:
-                _LOG.warning("[%s] Scheduled backup failed", self.log_id)
-
+                _LOG.debug(
+                    "[%s] Skipping scheduled backup, web server not running",
+                    self.log_id,
+                )
         except Exception as e:
             _LOG.error("[%s] Error during scheduled backup: %s", self.log_id, e)
 
+    def _schedule_next_backup(self) -> None:
+        """Move the due time of the scheduled backup to its next occurrence."""
+        if self._backup_due is None or self._backup_schedule is None:
+            return
+        try:
+            self._backup_due = _next_occurrence(
+                self._backup_schedule[1], datetime.now()
+            )
+        except ValueError:
+            self._backup_due = None
+
     # =========================================================================
     # Command Handling
     # =========================================================================
@@ -15,27 +15,71 @@ import os
 from const import RemoteConfig
 from device import IntegrationManagerDevice
 from discover import ManagerDiscovery
-from log_handler import setup_log_handler
+from github_api import close_shared_session
+from log_handler import MAX_LOG_ENTRIES, setup_log_handler
+from notification_manager import set_notification_loop
+from notification_service import close_session as close_notification_session
+from remote_api import close_shared_connector
 from setup import RemoteSetupFlow
 from ucapi_framework import BaseConfigManager, BaseIntegrationDriver, get_config_path
 
+try:
+    import uvloop
+except ImportError:  # Optional speedup, not available on every platform
+    uvloop = None
+
+_LOG = logging.getLogger(__name__)
+
+# Loggers of this integration that follow UC_LOG_LEVEL; all others keep the
+# root logger's level
+LOGGERS = (
+    "driver",
+    "device",
+    "setup",
+    "web_server",
+    "remote_api",
+    "github_api",
+    "integration_service",
+)
+
+
+def _log_buffer_size() -> int:
+    """
+    Get the number of log entries kept for the web UI from UC_LOG_BUFFER.
+
+    :return: The configured size, or MAX_LOG_ENTRIES if unset or invalid
+    """
+    value = os.getenv("UC_LOG_BUFFER", "").strip()
+    if not value:
+        return MAX_LOG_ENTRIES
+    try:
+        size = int(value)
+    except ValueError:
+        size = 0
+    if size > 0:
+        return size
+    _LOG.warning(
+        "Invalid UC_LOG_BUFFER value '%s', keeping %d log entries",
+        value,
+        MAX_LOG_ENTRIES,
+    )
+    return MAX_LOG_ENTRIES
+
 
 async def main():
     """Start the Integration Manager driver."""
     logging.basicConfig()
 
     # Set up the ring buffer log handler to capture logs for the web UI
-    setup_log_handler()
+    setup_log_handler(_log_buffer_size())
 
     # Configure logging level from environment variable
     level = os.getenv("UC_LOG_LEVEL", "DEBUG").upper()
-    logging.getLogger("driver").setLevel(level)
-    logging.getLogger("device").setLevel(level)
-    logging.getLogger("setup").setLevel(level)
-    logging.getLogger("web_server").setLevel(level)
-    logging.getLogger("remote_api").setLevel(level)
-    logging.getLogger("github_api").setLevel(level)
-    logging.getLogger("integration_service").setLevel(level)
+    for name in LOGGERS:
+        logging.getLogger(name).setLevel(level)
+
+    # Send notifications from the web server threads on this loop
+    set_notification_loop(asyncio.get_running_loop())
 
     # Initialize the integration driver
     # This integration doesn't expose entities - it's purely a web UI
@@ -63,8 +107,17 @@ async def main():
     await driver.api.init("driver.json", setup_handler)
 
     # Keep the driver running
-    await asyncio.Future()
+    try:
+        await asyncio.Future()
+    finally:
+        set_notification_loop(None)
+        await close_shared_session()
+        await close_shared_connector()
+        await close_notification_session()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    if uvloop is not None:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
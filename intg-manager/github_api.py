@@ -7,9 +7,13 @@ release information for integrations.
 :license: Mozilla Public License Version 2.0, see LICENSE for more details.
 """
 
+import asyncio
+import functools
 import logging
 import re
 import ssl
+import time
+from itertools import zip_longest
 from typing import Any
 
 import aiohttp
@@ -19,11 +23,76 @@ from const import GITHUB_API_BASE
 
 _LOG = logging.getLogger(__name__)
 
+# Owner and repository of a GitHub URL, ignoring ".git", sub-paths, query and fragment
+_GITHUB_URL_RE = re.compile(r"github\.com/([^/]+)/([^/?#]+?)(?:\.git)?(?:[/?#].*)?$")
+
+# Numeric parts of a version string
+_VERSION_NUM_RE = re.compile(r"\d+")
+
+# Minimum seconds to back off after hitting the GitHub rate limit
+RATE_LIMIT_BACKOFF = 60
+
+
+# HTTP session shared by all GitHub clients and the event loop it belongs to
+_SHARED_SESSION: aiohttp.ClientSession | None = None
+_SHARED_SESSION_LOOP: asyncio.AbstractEventLoop | None = None
+
 
 class GitHubAPIError(Exception):
     """Exception raised when GitHub API calls fail."""
 
 
+async def _get_shared_session() -> aiohttp.ClientSession:
+    """
+    Get or create the HTTP session shared by all GitHub clients.
+
+    Pooled keep-alive connections and cached DNS lookups let consecutive
+    requests skip the TCP and TLS handshakes.
+    """
+    global _SHARED_SESSION, _SHARED_SESSION_LOOP
+
+    loop = asyncio.get_running_loop()
+    if (
+        _SHARED_SESSION is None
+        or _SHARED_SESSION.closed
+        or _SHARED_SESSION_LOOP is not loop
+    ):
+        headers = {
+            "Accept": "application/vnd.github.v3+json",
+            "User-Agent": "uc-intg-manager",
+        }
+        # Create timeout object explicitly to avoid context manager issues
+        timeout = aiohttp.ClientTimeout(total=30)
+
+        # Create SSL context with certifi certificates for HTTPS
+        ssl_context = ssl.create_default_context(cafile=certifi.where())
+        connector = aiohttp.TCPConnector(
+            ssl=ssl_context,
+            limit=32,
+            limit_per_host=8,
+            ttl_dns_cache=300,
+            enable_cleanup_closed=True,
+        )
+
+        _SHARED_SESSION = aiohttp.ClientSession(
+            headers=headers,
+            timeout=timeout,
+            connector=connector,
+        )
+        _SHARED_SESSION_LOOP = loop
+    return _SHARED_SESSION
+
+
+async def close_shared_session() -> None:
+    """Close the HTTP session shared by all GitHub clients."""
+    global _SHARED_SESSION, _SHARED_SESSION_LOOP
+
+    if _SHARED_SESSION and not _SHARED_SESSION.closed:
+        await _SHARED_SESSION.close()
+    _SHARED_SESSION = None
+    _SHARED_SESSION_LOOP = None
+
+
 class GitHubClient:
     """
     Client for interacting with the GitHub API.
@@ -31,37 +100,58 @@ class GitHubClient:
     Fetches release information to determine if updates are available.
     """
 
-    def __init__(self) -> None:
-        """Initialize the GitHub API client."""
-        self._session: aiohttp.ClientSession | None = None
+    def __init__(self, cache_ttl: int = 300) -> None:
+        """
+        Initialize the GitHub API client.
+
+        :param cache_ttl: Seconds a latest release lookup is reused
+        """
+        self._cache_ttl = cache_ttl
+        # Latest release per (owner, repo) as (fetched_at, release)
+        self._release_cache: dict[
+            tuple[str, str], tuple[float, dict[str, Any] | None]
+        ] = {}
+        # Lookups in progress, shared by concurrent callers
+        self._inflight: dict[tuple[str, str], asyncio.Future] = {}
+        # Last successful response per URL as (ETag, decoded JSON)
+        self._etag_cache: dict[str, tuple[str, Any]] = {}
+        # Monotonic time until which requests are skipped after a rate limit
+        self._rate_limited_until = 0.0
+
+    @property
+    def is_throttled(self) -> bool:
+        """Whether requests are skipped because the rate limit was hit."""
+        return time.monotonic() < self._rate_limited_until
+
+    def _set_rate_limited(self, headers: Any) -> None:
+        """
+        Skip requests until the rate limit resets.
+
+        :param headers: Headers of the rate limited response
+        """
+        now = time.time()
+        try:
+            reset = int(headers.get("X-RateLimit-Reset", "0"))
+        except ValueError:
+            reset = 0
+        self._rate_limited_until = (
+            max(reset, now + RATE_LIMIT_BACKOFF) - now + time.monotonic()
+        )
 
     async def _get_session(self) -> aiohttp.ClientSession:
-        """Get or create an aiohttp session."""
-        if self._session is None or self._session.closed:
-            headers = {
-                "Accept": "application/vnd.github.v3+json",
-                "User-Agent": "uc-intg-manager",
-            }
-            # Create timeout object explicitly to avoid context manager issues
-            timeout = aiohttp.ClientTimeout(total=30)
-            
-            # Create SSL context with certifi certificates for HTTPS
-            ssl_context = ssl.create_default_context(cafile=certifi.where())
-            connector = aiohttp.TCPConnector(ssl=ssl_context)
-            
-            self._session = aiohttp.ClientSession(
-                headers=headers,
-                timeout=timeout,
-                connector=connector,
-            )
-        return self._session
+        """Get the HTTP session shared by all GitHub clients."""
+        return await _get_shared_session()
 
     async def close(self) -> None:
-        """Close the HTTP session."""
-        if self._session and not self._session.closed:
-            await self._session.close()
+        """
+        Release the client.
+
+        The HTTP session is shared by all clients and closed once on shutdown
+        through close_shared_session().
+        """
 
     @staticmethod
+    @functools.lru_cache(maxsize=256)
     def parse_github_url(home_page: str) -> tuple[str, str] | None:
         """
         Parse a GitHub URL to extract owner and repo.
@@ -69,46 +159,80 @@ class GitHubClient:
         :param home_page: GitHub URL (e.g., https://github.com/owner/repo)
         :return: Tuple of (owner, repo) or None if not a valid GitHub URL
         """
-        patterns = [
-            r"github\.com/([^/]+)/([^/]+?)(?:\.git)?(?:/.*)?$",
-            r"github\.com/([^/]+)/([^/]+)$",
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, home_page)
-            if match:
-                return match.group(1), match.group(2).rstrip("/")
+        match = _GITHUB_URL_RE.search(home_page)
+        if match:
+            return match.group(1), match.group(2)
         return None
 
     async def get_latest_release(self, owner: str, repo: str) -> dict[str, Any] | None:
         """
         Get the latest release for a repository.
 
+        Results are cached for cache_ttl seconds, and concurrent lookups of
+        the same repository share a single request.
+
+        :param owner: Repository owner
+        :param repo: Repository name
+        :return: Release data dictionary or None if no releases
+        """
+        key = (owner, repo)
+        cached = self._release_cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < self._cache_ttl:
+            return cached[1]
+        if self.is_throttled:
+            return None
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            return await asyncio.shield(inflight)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            release = await self._fetch_latest_release(owner, repo)
+            self._release_cache[key] = (time.monotonic(), release)
+            future.set_result(release)
+            return release
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Don't warn about an exception nobody else was waiting for
+            future.exception()
+            raise
+        finally:
+            del self._inflight[key]
+
+    async def _fetch_latest_release(
+        self, owner: str, repo: str
+    ) -> dict[str, Any] | None:
+        """
+        Request the latest release for a repository from GitHub.
+
         :param owner: Repository owner
         :param repo: Repository name
         :return: Release data dictionary or None if no releases
         """
-        session = await self._get_session()
         url = f"{GITHUB_API_BASE}/repos/{owner}/{repo}/releases/latest"
 
         try:
-            async with session.get(url) as response:
-                if response.status == 404:
-                    # No releases found, try tags
-                    return await self._get_latest_tag(owner, repo)
-                if response.status == 403:
-                    _LOG.warning("GitHub API rate limit exceeded")
-                    return None
-                if response.status >= 400:
-                    _LOG.warning(
-                        "GitHub API error %d for %s/%s", response.status, owner, repo
-                    )
-                    return None
-                return await response.json()
+            status, data = await self._conditional_get(url)
         except aiohttp.ClientError as e:
             _LOG.error("GitHub API connection error: %s", e)
             return None
 
+        if status == 404:
+            # No releases found, try tags
+            return await self._get_latest_tag(owner, repo)
+        if status == 403 and self.is_throttled:
+            _LOG.warning("GitHub API rate limit exceeded")
+            return None
+        if status >= 400:
+            _LOG.warning("GitHub API error %d for %s/%s", status, owner, repo)
+            return None
+        return data
+
     async def _get_latest_tag(self, owner: str, repo: str) -> dict[str, Any] | None:
         """
         Get the latest tag for a repository (fallback when no releases).
@@ -117,21 +241,55 @@ class GitHubClient:
         :param repo: Repository name
         :return: Tag data as release-like dictionary or None
         """
-        session = await self._get_session()
         url = f"{GITHUB_API_BASE}/repos/{owner}/{repo}/tags"
 
         try:
-            async with session.get(url) as response:
-                if response.status >= 400:
-                    return None
-                tags = await response.json()
-                if tags:
-                    return {"tag_name": tags[0].get("name", "unknown")}
-                return None
+            status, tags = await self._conditional_get(url)
         except aiohttp.ClientError:
             return None
 
+        if status >= 400:
+            return None
+        if tags:
+            return {"tag_name": tags[0].get("name", "unknown")}
+        return None
+
+    async def _conditional_get(self, url: str) -> tuple[int, Any]:
+        """
+        GET a GitHub API URL, revalidating the previous response by its ETag.
+
+        A 304 Not Modified reply is answered with the cached JSON and reported
+        as status 200, so it costs neither a body download nor a JSON decode.
+        A 403 reply without remaining requests starts the rate limit backoff
+        reported by is_throttled. Other 403 replies (e.g. missing permissions)
+        are returned like any other error status.
+
+        :param url: API URL
+        :return: Tuple of (status, decoded JSON or None for error statuses)
+        :raises aiohttp.ClientError: If the request fails
+        """
+        session = await self._get_session()
+        cached = self._etag_cache.get(url)
+        headers = {"If-None-Match": cached[0]} if cached else None
+
+        async with session.get(url, headers=headers) as response:
+            if response.status == 304 and cached:
+                return 200, cached[1]
+            if (
+                response.status == 403
+                and response.headers.get("X-RateLimit-Remaining") == "0"
+            ):
+                self._set_rate_limited(response.headers)
+            if response.status >= 400:
+                return response.status, None
+            data = await response.json()
+            etag = response.headers.get("ETag")
+            if etag:
+                self._etag_cache[url] = (etag, data)
+            return response.status, data
+
     @staticmethod
+    @functools.lru_cache(maxsize=256)
     def parse_version(version_str: str) -> tuple[int, ...]:
         """
         Parse a version string into a comparable tuple.
@@ -139,11 +297,8 @@ class GitHubClient:
         :param version_str: Version string (e.g., "v1.2.3", "1.2.3")
         :return: Tuple of version numbers
         """
-        # Remove 'v' prefix if present
-        version_str = version_str.lstrip("vV")
-
-        # Extract numeric parts
-        parts = re.findall(r"\d+", version_str)
+        # Extract numeric parts, which also skips a 'v' prefix
+        parts = _VERSION_NUM_RE.findall(version_str)
         return tuple(int(p) for p in parts) if parts else (0,)
 
     @staticmethod
@@ -155,15 +310,15 @@ class GitHubClient:
         :param latest: Latest available version
         :return: True if latest is newer than current
         """
-        current_parts = GitHubClient.parse_version(current)
-        latest_parts = GitHubClient.parse_version(latest)
-
-        # Pad shorter tuple with zeros
-        max_len = max(len(current_parts), len(latest_parts))
-        current_padded = current_parts + (0,) * (max_len - len(current_parts))
-        latest_padded = latest_parts + (0,) * (max_len - len(latest_parts))
-
-        return latest_padded > current_padded
+        # Compare part by part, treating missing parts as zeros
+        for current_part, latest_part in zip_longest(
+            GitHubClient.parse_version(current),
+            GitHubClient.parse_version(latest),
+            fillvalue=0,
+        ):
+            if latest_part != current_part:
+                return latest_part > current_part
+        return False
 
     async def get_latest_version(self, home_page: str) -> str | None:
         """
@@ -8,24 +8,55 @@ combining Remote API and GitHub API to provide complete integration info.
 """
 
 import asyncio
-import json
 import logging
 import os
 import ssl
+import time
+from collections.abc import AsyncIterator
 from dataclasses import dataclass
 from typing import Any
 
 import aiohttp
 import certifi
+import orjson
 
-from const import KNOWN_INTEGRATIONS_URL
+from const import (
+    KNOWN_INTEGRATIONS_CACHE_TTL,
+    KNOWN_INTEGRATIONS_URL,
+    atomic_write_json,
+)
 from github_api import GitHubClient
 from remote_api import RemoteAPIClient, RemoteAPIError
 
 _LOG = logging.getLogger(__name__)
 
+# Seconds driver metadata from the remote is reused
+DRIVER_CACHE_TTL = 60
 
-@dataclass
+# Maximum number of integrations looked up at once
+INTEGRATION_INFO_CONCURRENCY = 8
+
+# Seconds the installed driver IDs are reused
+INSTALLED_IDS_CACHE_TTL = 5
+
+
+def _pick_locale(value: Any, default: str = "") -> Any:
+    """
+    Pick the text of a multi-language value.
+
+    :param value: Language code to text mapping, or plain text
+    :param default: Text if the mapping is empty
+    :return: The English text, else the first language's, else the default
+    """
+    if not isinstance(value, dict):
+        return value
+    text = value.get("en")
+    if text is not None:
+        return text
+    return next(iter(value.values()), default)
+
+
+@dataclass(slots=True)
 class IntegrationInfo:
     """Information about an installed integration."""
 
@@ -54,7 +85,7 @@ class IntegrationInfo:
     configured_entities: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class AvailableIntegration:
     """Information about an available integration from the registry."""
 
@@ -92,53 +123,120 @@ class IntegrationService:
         self._remote = remote_client
         self._github = GitHubClient()
         self._known_integrations: list[dict[str, Any]] = []
+        # Driver metadata per driver_id as (fetched_at, driver)
+        self._driver_cache: dict[str, tuple[float, dict[str, Any]]] = {}
+        # Driver lookups in progress, shared by concurrent callers
+        self._driver_inflight: dict[str, asyncio.Future] = {}
+        # Installed driver IDs as (fetched_at, driver_ids)
+        self._installed_ids_cache: tuple[float, set[str]] | None = None
+        # Validator and download time (epoch) of the known integrations
+        self._known_etag: str | None = None
+        self._known_fetched_at = 0.0
+        self._session: aiohttp.ClientSession | None = None
         self._cache_file = os.path.join(
             os.environ.get("UC_DATA_HOME", "."), "integrations_cache.json"
         )
 
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Get or create the aiohttp session for registry requests."""
+        if self._session is None or self._session.closed:
+            timeout = aiohttp.ClientTimeout(total=30)
+            ssl_context = ssl.create_default_context(cafile=certifi.where())
+            connector = aiohttp.TCPConnector(
+                ssl=ssl_context,
+                limit=20,
+                keepalive_timeout=75,
+                enable_cleanup_closed=True,
+            )
+            self._session = aiohttp.ClientSession(timeout=timeout, connector=connector)
+        return self._session
+
     async def close(self) -> None:
         """Close all API clients."""
         await self._remote.close()
         await self._github.close()
+        if self._session and not self._session.closed:
+            await self._session.close()
 
     async def load_known_integrations(self) -> list[dict[str, Any]]:
         """
         Load the list of known integrations from the registry.
 
+        A cached registry younger than KNOWN_INTEGRATIONS_CACHE_TTL is used
+        as is; an older one is revalidated by its ETag, so an unchanged
+        registry isn't downloaded again.
+
         :return: List of known integration dictionaries
         """
+        # File I/O runs in a worker thread to keep the event loop responsive
+        if not self._known_integrations:
+            await asyncio.to_thread(self._load_cached_integrations)
+        if (
+            self._known_integrations
+            and time.time() - self._known_fetched_at < KNOWN_INTEGRATIONS_CACHE_TTL
+        ):
+            return self._known_integrations
+
+        headers = (
+            {"If-None-Match": self._known_etag}
+            if self._known_integrations and self._known_etag
+            else None
+        )
         try:
-            timeout = aiohttp.ClientTimeout(total=30)
-            ssl_context = ssl.create_default_context(cafile=certifi.where())
-            connector = aiohttp.TCPConnector(ssl=ssl_context)
-            async with aiohttp.ClientSession(timeout=timeout, connector=connector) as session:
-                async with session.get(KNOWN_INTEGRATIONS_URL) as response:
-                    if response.status == 200:
-                        self._known_integrations = await response.json()
-                        # Cache for offline use
-                        self._cache_known_integrations()
-                        return self._known_integrations
+            session = await self._get_session()
+            async with session.get(KNOWN_INTEGRATIONS_URL, headers=headers) as response:
+                if response.status == 304:
+                    self._known_fetched_at = time.time()
+                    await asyncio.to_thread(self._cache_known_integrations)
+                elif response.status == 200:
+                    # Imported on first use: probing the ijson backends is slow
+                    import ijson  # pylint: disable=import-outside-toplevel
+
+                    # Build the entries while the body streams in, instead of
+                    # buffering the whole document before decoding it
+                    self._known_integrations = [
+                        item
+                        async for item in ijson.items_async(
+                            response.content, "item", use_float=True
+                        )
+                    ]
+                    self._known_etag = response.headers.get("ETag")
+                    self._known_fetched_at = time.time()
+                    # Cache for offline use
+                    await asyncio.to_thread(self._cache_known_integrations)
         except Exception as e:
             _LOG.warning("Failed to fetch known integrations: %s", e)
 
-        # Try to load from cache
-        return self._load_cached_integrations()
+        return self._known_integrations
 
     def _cache_known_integrations(self) -> None:
-        """Cache known integrations to disk."""
+        """Cache known integrations to disk (atomically, blocking)."""
         try:
-            with open(self._cache_file, "w") as f:
-                json.dump(self._known_integrations, f)
+            atomic_write_json(
+                self._cache_file,
+                {
+                    "fetched_at": self._known_fetched_at,
+                    "etag": self._known_etag,
+                    "data": self._known_integrations,
+                },
+            )
         except Exception as e:
             _LOG.warning("Failed to cache integrations: %s", e)
 
     def _load_cached_integrations(self) -> list[dict[str, Any]]:
-        """Load cached integrations from disk."""
+        """Load cached integrations from disk (blocking)."""
         try:
             if os.path.exists(self._cache_file):
-                with open(self._cache_file, "r") as f:
-                    self._known_integrations = json.load(f)
-                    return self._known_integrations
+                with open(self._cache_file, "rb") as f:
+                    cache = orjson.loads(f.read())
+                if isinstance(cache, list):
+                    # Old cache format without validator, revalidate on next load
+                    self._known_integrations = cache
+                else:
+                    self._known_integrations = cache.get("data") or []
+                    self._known_etag = cache.get("etag")
+                    self._known_fetched_at = cache.get("fetched_at", 0.0)
+                return self._known_integrations
         except Exception as e:
             _LOG.warning("Failed to load cached integrations: %s", e)
         return []
@@ -150,32 +248,46 @@ class IntegrationService:
         Get all installed integrations with update status.
 
         :param check_updates: Whether to check GitHub for updates
-        :return: List of IntegrationInfo objects
+        :return: List of IntegrationInfo objects, in order of completion
         """
-        integrations: list[IntegrationInfo] = []
+        return [info async for info in self.iter_installed_integrations(check_updates)]
 
+    async def iter_installed_integrations(
+        self, check_updates: bool = True
+    ) -> AsyncIterator[IntegrationInfo]:
+        """
+        Yield the installed integrations with update status as they complete.
+
+        :param check_updates: Whether to check GitHub for updates
+        """
         try:
             instances = await self._remote.get_integration_instances()
         except RemoteAPIError as e:
             _LOG.error("Failed to fetch integration instances: %s", e)
-            return integrations
+            return
 
-        # Fetch driver details for each instance
-        tasks = []
-        for instance in instances:
-            driver_id = instance.get("driver_id", "")
-            if driver_id:
-                tasks.append(self._get_integration_info(instance, check_updates))
+        # Fetch driver details for each instance, a few at a time
+        semaphore = asyncio.Semaphore(INTEGRATION_INFO_CONCURRENCY)
 
-        if tasks:
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-            for result in results:
-                if isinstance(result, IntegrationInfo):
-                    integrations.append(result)
-                elif isinstance(result, Exception):
-                    _LOG.warning("Failed to get integration info: %s", result)
+        async def _get_info(instance: dict[str, Any]) -> IntegrationInfo:
+            async with semaphore:
+                return await self._get_integration_info(instance, check_updates)
 
-        return integrations
+        tasks = [
+            asyncio.create_task(_get_info(instance))
+            for instance in instances
+            if instance.get("driver_id")
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                try:
+                    yield await next_done
+                except Exception as e:
+                    _LOG.warning("Failed to get integration info: %s", e)
+        finally:
+            # Stop the remaining lookups when the caller stops early
+            for task in tasks:
+                task.cancel()
 
     async def _get_integration_info(
         self, instance: dict[str, Any], check_updates: bool
@@ -191,21 +303,13 @@ class IntegrationService:
 
         # Get driver metadata
         try:
-            driver = await self._remote.get_driver(driver_id)
+            driver = await self._get_driver_cached(driver_id)
         except RemoteAPIError:
             driver = {}
 
-        # Extract name (handle multi-language)
-        name = driver.get("name", {})
-        if isinstance(name, dict):
-            name = name.get("en", name.get(list(name.keys())[0], driver_id))
-
-        # Extract description
-        description = driver.get("description", {})
-        if isinstance(description, dict):
-            description = description.get(
-                "en", description.get(list(description.keys())[0], "")
-            )
+        # Extract name and description (handle multi-language)
+        name = _pick_locale(driver.get("name", {}), driver_id)
+        description = _pick_locale(driver.get("description", {}))
 
         # Extract developer
         developer_info = driver.get("developer", {})
@@ -238,35 +342,63 @@ class IntegrationService:
 
         return info
 
+    async def _get_driver_cached(self, driver_id: str) -> dict[str, Any]:
+        """
+        Get driver metadata from the remote.
+
+        Results are cached for DRIVER_CACHE_TTL seconds, and concurrent
+        lookups of the same driver (e.g. for several of its instances) share
+        a single request.
+
+        :param driver_id: Driver ID
+        :return: Driver data
+        :raises RemoteAPIError: If the request fails
+        """
+        cached = self._driver_cache.get(driver_id)
+        if cached is not None and time.monotonic() - cached[0] < DRIVER_CACHE_TTL:
+            return cached[1]
+
+        inflight = self._driver_inflight.get(driver_id)
+        if inflight is not None:
+            return await asyncio.shield(inflight)
+
+        future = asyncio.get_running_loop().create_future()
+        self._driver_inflight[driver_id] = future
+        try:
+            driver = await self._remote.get_driver(driver_id)
+            self._driver_cache[driver_id] = (time.monotonic(), driver)
+            future.set_result(driver)
+            return driver
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Don't warn about an exception nobody else was waiting for
+            future.exception()
+            raise
+        finally:
+            del self._driver_inflight[driver_id]
+
     async def get_available_integrations(self) -> list[AvailableIntegration]:
         """
         Get list of available integrations from the registry.
 
         :return: List of AvailableIntegration objects
         """
+        return [intg async for intg in self.iter_available_integrations()]
+
+    async def iter_available_integrations(self) -> AsyncIterator[AvailableIntegration]:
+        """Yield the available integrations from the registry one at a time."""
         if not self._known_integrations:
             await self.load_known_integrations()
 
-        # Get currently installed driver IDs
-        installed_ids: set[str] = set()
-        try:
-            drivers = await self._remote.get_all_drivers()
-            installed_ids = {d.get("driver_id", "") for d in drivers}
-        except RemoteAPIError as e:
-            _LOG.warning("Failed to fetch installed drivers: %s", e)
-
-        available: list[AvailableIntegration] = []
+        installed_ids = await self._get_installed_ids()
 
         for intg in self._known_integrations:
-            # Extract name
-            name = intg.get("name", {})
-            if isinstance(name, dict):
-                name = name.get("en", intg.get("driver_id", "Unknown"))
-
-            # Extract description
-            description = intg.get("description", {})
-            if isinstance(description, dict):
-                description = description.get("en", "")
+            # Extract name and description (handle multi-language)
+            name = _pick_locale(intg.get("name", {}), intg.get("driver_id", "Unknown"))
+            description = _pick_locale(intg.get("description", {}))
 
             # Extract developer
             developer_info = intg.get("developer", {})
@@ -278,23 +410,49 @@ class IntegrationService:
 
             driver_id = intg.get("driver_id", "")
 
-            available.append(
-                AvailableIntegration(
-                    driver_id=driver_id,
-                    name=name if isinstance(name, str) else str(name),
-                    description=description
-                    if isinstance(description, str)
-                    else str(description),
-                    icon=intg.get("icon", ""),
-                    home_page=intg.get("home_page", ""),
-                    developer=developer,
-                    version=intg.get("version", ""),
-                    category=intg.get("category", ""),
-                    installed=driver_id in installed_ids,
-                )
+            yield AvailableIntegration(
+                driver_id=driver_id,
+                name=name if isinstance(name, str) else str(name),
+                description=(
+                    description if isinstance(description, str) else str(description)
+                ),
+                icon=intg.get("icon", ""),
+                home_page=intg.get("home_page", ""),
+                developer=developer,
+                version=intg.get("version", ""),
+                category=intg.get("category", ""),
+                installed=driver_id in installed_ids,
             )
 
-        return available
+    async def _get_installed_ids(self) -> set[str]:
+        """
+        Get the IDs of the drivers installed on the remote.
+
+        The result is reused for INSTALLED_IDS_CACHE_TTL seconds, or until
+        invalidate_installed() is called.
+
+        :return: Set of driver IDs, empty if the request failed
+        """
+        cached = self._installed_ids_cache
+        if (
+            cached is not None
+            and time.monotonic() - cached[0] < INSTALLED_IDS_CACHE_TTL
+        ):
+            return cached[1]
+
+        try:
+            drivers = await self._remote.get_all_drivers()
+        except RemoteAPIError as e:
+            _LOG.warning("Failed to fetch installed drivers: %s", e)
+            return set()
+
+        installed_ids = {d.get("driver_id", "") for d in drivers}
+        self._installed_ids_cache = (time.monotonic(), installed_ids)
+        return installed_ids
+
+    def invalidate_installed(self) -> None:
+        """Forget the cached installed drivers, e.g. after an install."""
+        self._installed_ids_cache = None
 
     async def refresh_integration(self, instance_id: str) -> IntegrationInfo | None:
         """
@@ -304,12 +462,12 @@ class IntegrationService:
         :return: Updated IntegrationInfo or None
         """
         try:
-            instances = await self._remote.get_integration_instances()
-            for instance in instances:
-                if instance.get("integration_id") == instance_id:
-                    return await self._get_integration_info(
-                        instance, check_updates=True
-                    )
+            instance = await self._remote.get_instance(instance_id)
         except RemoteAPIError as e:
             _LOG.error("Failed to refresh integration: %s", e)
-        return None
+            return None
+        if not isinstance(instance, dict):
+            return None
+
+        self._driver_cache.pop(instance.get("driver_id", ""), None)
+        return await self._get_integration_info(instance, check_updates=True)
@@ -9,23 +9,47 @@ when the buffer is full.
 """
 
 import logging
+import time
 from collections import deque
-from dataclasses import dataclass
-from datetime import datetime
-from threading import Lock
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from itertools import islice
 
 # Maximum number of log entries to keep
 MAX_LOG_ENTRIES = 200
 
+# Message argument types that can't change after logging, so formatting the
+# message can wait until it is displayed
+_IMMUTABLE_ARG_TYPES = (str, int, float, bool, type(None))
 
-@dataclass
+
+@dataclass(slots=True)
 class LogEntry:
-    """A single log entry."""
+    """
+    A single log entry.
+
+    The message is formatted on first access; most entries are discarded by
+    the ring buffer without ever being displayed.
+    """
 
     timestamp: str
     level: str
     logger: str
-    message: str
+    _text: str | None = field(default=None, repr=False)
+    _record: logging.LogRecord | None = field(default=None, repr=False)
+    _format: Callable[[logging.LogRecord], str] | None = field(default=None, repr=False)
+
+    @property
+    def message(self) -> str:
+        """The formatted log message."""
+        text = self._text
+        if text is None:
+            try:
+                text = self._format(self._record)
+            except Exception:
+                text = str(self._record.msg)
+            self._text = text
+        return text
 
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization."""
@@ -42,7 +66,8 @@ class RingBufferHandler(logging.Handler):
     A logging handler that stores log records in a ring buffer.
 
     Thread-safe implementation that automatically discards oldest
-    entries when the buffer reaches MAX_LOG_ENTRIES.
+    entries when the buffer reaches MAX_LOG_ENTRIES. Records are stored
+    under the handler lock that logging already holds around emit().
     """
 
     def __init__(self, max_entries: int = MAX_LOG_ENTRIES):
@@ -51,37 +76,49 @@ class RingBufferHandler(logging.Handler):
 
         :param max_entries: Maximum number of log entries to store
         """
-        super().__init__()
+        # DEBUG records are rejected by the level check before emit() is called
+        super().__init__(logging.INFO)
         self._buffer: deque[LogEntry] = deque(maxlen=max_entries)
-        self._lock = Lock()
+        # Last formatted timestamp as (epoch second, text)
+        self._timestamp: tuple[int, str] = (-1, "")
 
     def emit(self, record: logging.LogRecord) -> None:
         """
         Store the log record in the ring buffer.
 
-        DEBUG level messages are excluded.
-
         :param record: The log record to store
         """
-        # Skip DEBUG level messages
-        if record.levelno <= logging.DEBUG:
-            return
-
         try:
+            lazy = _can_format_later(record)
             entry = LogEntry(
-                timestamp=datetime.fromtimestamp(record.created).strftime(
-                    "%Y-%m-%d %H:%M:%S"
-                ),
+                timestamp=self._format_timestamp(record.created),
                 level=record.levelname,
                 logger=record.name,
-                message=self.format(record),
+                _text=None if lazy else self.format(record),
+                _record=record if lazy else None,
+                _format=self.format if lazy else None,
             )
-            with self._lock:
-                self._buffer.append(entry)
+            self._buffer.append(entry)
         except Exception:
             # Don't let logging failures crash the application
             self.handleError(record)
 
+    def _format_timestamp(self, created: float) -> str:
+        """
+        Format a record's creation time, reusing the text within a second.
+
+        :param created: Creation time of the record (epoch seconds)
+        """
+        second = int(created)
+        cached = self._timestamp
+        if cached[0] != second:
+            cached = (
+                second,
+                time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(second)),
+            )
+            self._timestamp = cached
+        return cached[1]
+
     def get_entries(self, limit: int | None = None) -> list[LogEntry]:
         """
         Get log entries from the buffer.
@@ -89,39 +126,50 @@ class RingBufferHandler(logging.Handler):
         :param limit: Maximum number of entries to return (None for all)
         :return: List of log entries (newest first)
         """
-        with self._lock:
-            entries = list(self._buffer)
-
-        # Reverse to show newest first
-        entries.reverse()
-
-        if limit is not None:
-            entries = entries[:limit]
-
-        return entries
+        # Newest first, only copying the requested entries
+        with self.lock:
+            return list(islice(reversed(self._buffer), limit))
 
     def clear(self) -> None:
         """Clear all entries from the buffer."""
-        with self._lock:
+        with self.lock:
             self._buffer.clear()
 
     def __len__(self) -> int:
         """Return the number of entries in the buffer."""
-        with self._lock:
-            return len(self._buffer)
+        return len(self._buffer)
+
+
+def _can_format_later(record: logging.LogRecord) -> bool:
+    """
+    Check if formatting a log record can be deferred.
+
+    Records with exception or stack info, or with arguments that might be
+    mutated after logging, are formatted right away.
+
+    :param record: The log record
+    """
+    if record.exc_info or record.stack_info or not isinstance(record.msg, str):
+        return False
+    args = record.args
+    return not args or (
+        isinstance(args, tuple)
+        and all(isinstance(arg, _IMMUTABLE_ARG_TYPES) for arg in args)
+    )
 
 
 # Global handler instance
 _handler: RingBufferHandler | None = None
 
 
-def setup_log_handler() -> RingBufferHandler:
+def setup_log_handler(max_entries: int = MAX_LOG_ENTRIES) -> RingBufferHandler:
     """
     Set up the global ring buffer log handler.
 
     This attaches a handler to the root logger that captures all
     log messages from the application (excluding DEBUG level).
 
+    :param max_entries: Maximum number of log entries to store
     :return: The configured handler instance
     """
     global _handler
@@ -129,7 +177,7 @@ def setup_log_handler() -> RingBufferHandler:
     if _handler is not None:
         return _handler
 
-    _handler = RingBufferHandler()
+    _handler = RingBufferHandler(max_entries)
     _handler.setLevel(logging.INFO)  # Minimum INFO level
     _handler.setFormatter(logging.Formatter("%(message)s"))
 
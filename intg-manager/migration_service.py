@@ -20,6 +20,56 @@ from typing import Any
 
 _LOG = logging.getLogger(__name__)
 
+# Migration data of at least this many characters is stream-parsed
+STREAM_PARSE_MIN_SIZE = 4096
+
+# Key paths to the settings fields of a setup response and to a field's text
+_SETTINGS_PATH = ("require_user_action", "input", "settings")
+_TEXTAREA_VALUE_PATH = ("field", "textarea", "value")
+
+
+def _walk(data: Any, path: tuple[str, ...], default: Any) -> Any:
+    """
+    Look up a value in nested dictionaries.
+
+    :param data: Nested dictionaries
+    :param path: Keys to follow
+    :param default: Value if a key is missing or a level is not a dictionary
+    :return: The value at the end of the path, or the default
+    """
+    for key in path:
+        if not isinstance(data, dict):
+            return default
+        data = data.get(key)
+        if data is None:
+            return default
+    return data
+
+
+def _parse_entity_mappings(migration_json: str) -> Any:
+    """
+    Parse the entity mappings from the migration data JSON.
+
+    Large payloads are stream-parsed, so only the entity_mappings list is
+    built and not the rest of the document.
+
+    :param migration_json: JSON string with entity_mappings
+    :return: The entity_mappings value
+    :raises ValueError: If the JSON is invalid
+    """
+    if len(migration_json) < STREAM_PARSE_MIN_SIZE:
+        return json.loads(migration_json).get("entity_mappings", [])
+
+    # Imported on first use: probing the ijson backends is slow at startup
+    import ijson  # pylint: disable=import-outside-toplevel
+
+    try:
+        return list(
+            ijson.items(migration_json.encode(), "entity_mappings.item", use_float=True)
+        )
+    except ijson.JSONError as e:
+        raise ValueError(str(e)) from e
+
 
 def extract_migration_mappings(setup_response: dict[str, Any]) -> list[dict[str, str]]:
     """
@@ -56,30 +106,25 @@ def extract_migration_mappings(setup_response: dict[str, Any]) -> list[dict[str,
     """
     _LOG.debug("Extracting migration mappings from setup response")
     try:
-        settings = (
-            setup_response.get("require_user_action", {})
-            .get("input", {})
-            .get("settings", [])
-        )
+        settings = _walk(setup_response, _SETTINGS_PATH, [])
+        if not settings:
+            _LOG.debug("migration_data field not found in settings")
+            return []
         _LOG.debug("Looking for migration_data in %d settings fields", len(settings))
         for setting in settings:
             if setting.get("id") == "migration_data":
                 # The value is a JSON string in a textarea field
-                textarea_value = (
-                    setting.get("field", {}).get("textarea", {}).get("value", "")
-                )
+                textarea_value = _walk(setting, _TEXTAREA_VALUE_PATH, "")
                 _LOG.debug(
                     "Found migration_data field with textarea value: %s", textarea_value
                 )
 
                 if textarea_value:
                     try:
-                        # Parse the JSON string
-                        migration_data = json.loads(textarea_value)
-                        _LOG.debug("Parsed migration data: %s", migration_data)
+                        # Extract entity_mappings from the JSON string
+                        entity_mappings = _parse_entity_mappings(textarea_value)
+                        _LOG.debug("Parsed entity mappings: %s", entity_mappings)
 
-                        # Extract entity_mappings from the parsed data
-                        entity_mappings = migration_data.get("entity_mappings", [])
                         if isinstance(entity_mappings, list):
                             _LOG.info(
                                 "Found %d migration mappings", len(entity_mappings)
@@ -90,7 +135,7 @@ def extract_migration_mappings(setup_response: dict[str, Any]) -> list[dict[str,
                                 "entity_mappings is not a list: %s",
                                 type(entity_mappings),
                             )
-                    except json.JSONDecodeError as e:
+                    except ValueError as e:
                         _LOG.warning("Failed to parse migration_data JSON: %s", e)
                 else:
                     _LOG.warning("migration_data textarea value is empty")
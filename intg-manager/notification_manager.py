@@ -3,17 +3,35 @@
 from __future__ import annotations
 
 import asyncio
-import json
+import atexit
+import concurrent.futures
 import logging
-import os
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Coroutine
 from typing import Any
 
-from const import MANAGER_DATA_FILE
-from notification_service import NotificationService
+import orjson
+
+from const import MANAGER_DATA_FILE, atomic_write_json
+from notification_service import NotificationService, close_session
 from notification_settings import NotificationSettings
 
 _LOG = logging.getLogger(__name__)
 
+# Seconds to collect further changes before the notification state is written
+SAVE_DELAY = 0.5
+
+# Seconds loaded notification settings are reused
+SETTINGS_CACHE_TTL = 5.0
+
+# Most recent update notifications remembered, oldest are dropped first
+MAX_NOTIFIED_UPDATES = 1024
+
+# Seconds to wait for a notification run on the driver loop from another thread
+NOTIFICATION_RESULT_TIMEOUT = 30
+
 
 class NotificationManager:
     """
@@ -23,76 +41,191 @@ class NotificationManager:
     to all enabled providers when specific events occur.
     """
 
+    __slots__ = (
+        "_service",
+        "_notified_updates",
+        "_notified_errors",
+        "_notified_orphaned_activities",
+        "_save_timer",
+        "_save_lock",
+        "_write_lock",
+        "_settings_cache",
+        "_saved_state_hash",
+    )
+
     def __init__(self) -> None:
         """Initialize the notification manager."""
         self._service = NotificationService()
         # Track what we've already notified about to avoid spam
-        self._notified_updates: set[str] = set()  # {driver_id:version}
+        # {(driver_id, version): None}, in least recently used order
+        self._notified_updates: OrderedDict[tuple[str, str], None] = OrderedDict()
         self._notified_errors: dict[str, str] = {}  # {driver_id: error_state}
         self._notified_orphaned_activities: set[str] = set()  # {activity_id}
+        # Pending deferred save, and serialization of the writes themselves
+        self._save_timer: threading.Timer | None = None
+        self._save_lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        # Notification settings as (loaded_at, settings)
+        self._settings_cache: tuple[float, NotificationSettings] | None = None
+        # Hash of the notification state as last loaded or saved
+        self._saved_state_hash: int | None = None
         # Load persisted notification state from disk
         self._load_notification_state()
+        # Don't lose a pending save on exit
+        atexit.register(self.flush)
+
+    @staticmethod
+    def _read_manager_data() -> dict[str, Any]:
+        """
+        Read manager.json.
+
+        The file is shared with other components, so it is read again before
+        every save to keep their latest sections.
+
+        :return: Content of the file, empty if it doesn't exist
+        :raises orjson.JSONDecodeError: If the file is invalid
+        :raises OSError: If the file can't be read
+        """
+        try:
+            with open(MANAGER_DATA_FILE, "rb") as f:
+                return orjson.loads(f.read())
+        except FileNotFoundError:
+            return {}
 
     def _load_notification_state(self) -> None:
         """Load notification state from manager.json file."""
         try:
-            if os.path.exists(MANAGER_DATA_FILE):
-                with open(MANAGER_DATA_FILE, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    notification_state = data.get("notification_state", {})
-                    self._notified_updates = set(
-                        notification_state.get("notified_updates", [])
-                    )
-                    self._notified_errors = notification_state.get(
-                        "notified_errors", {}
-                    )
-                    self._notified_orphaned_activities = set(
-                        notification_state.get("notified_orphaned_activities", [])
-                    )
-                    _LOG.debug(
-                        "Loaded notification state: %d updates, %d errors, %d orphaned activities",
-                        len(self._notified_updates),
-                        len(self._notified_errors),
-                        len(self._notified_orphaned_activities),
-                    )
-        except (json.JSONDecodeError, OSError) as e:
+            data = self._read_manager_data()
+            if data:
+                notification_state = data.get("notification_state", {})
+                # Stored as "driver_id:version" strings
+                self._notified_updates = OrderedDict()
+                for key in notification_state.get("notified_updates", [])[
+                    -MAX_NOTIFIED_UPDATES:
+                ]:
+                    driver_id, _, version = key.rpartition(":")
+                    self._notified_updates[(driver_id, version)] = None
+                self._notified_errors = notification_state.get("notified_errors", {})
+                self._notified_orphaned_activities = set(
+                    notification_state.get("notified_orphaned_activities", [])
+                )
+                _LOG.debug(
+                    "Loaded notification state: %d updates, %d errors, %d orphaned activities",
+                    len(self._notified_updates),
+                    len(self._notified_errors),
+                    len(self._notified_orphaned_activities),
+                )
+        except (orjson.JSONDecodeError, OSError) as e:
             _LOG.warning("Failed to load notification state: %s", e)
+        self._saved_state_hash = self._state_hash(*self._snapshot_state())
+
+    def _snapshot_state(
+        self,
+    ) -> tuple[list[tuple[str, str]], dict[str, str], list[str]]:
+        """
+        Copy the notification state for saving.
+
+        Web server threads update the state while the save timer thread writes
+        it. Each copy is a single C-level call that doesn't release the GIL, so
+        no other thread can modify a collection while it is being copied.
+
+        :return: Notified updates, errors and orphaned activities
+        """
+        return (
+            list(self._notified_updates),
+            dict(self._notified_errors),
+            list(self._notified_orphaned_activities),
+        )
+
+    @staticmethod
+    def _state_hash(
+        updates: list[tuple[str, str]], errors: dict[str, str], orphaned: list[str]
+    ) -> int:
+        """Hash the notification state to detect changes since the last save."""
+        return hash(
+            (tuple(updates), tuple(sorted(errors.items())), frozenset(orphaned))
+        )
 
     def _save_notification_state(self) -> None:
         """Save notification state to manager.json file."""
+        updates, errors, orphaned = self._snapshot_state()
+        state_hash = self._state_hash(updates, errors, orphaned)
+        if state_hash == self._saved_state_hash:
+            _LOG.debug("Notification state unchanged, skipping save")
+            return
         try:
-            # Load existing data to preserve other sections
-            existing_data = {}
-            if os.path.exists(MANAGER_DATA_FILE):
-                try:
-                    with open(MANAGER_DATA_FILE, "r", encoding="utf-8") as f:
-                        existing_data = json.load(f)
-                except (json.JSONDecodeError, OSError):
-                    pass
+            # Keep the other sections as they are on disk now
+            try:
+                existing_data = self._read_manager_data()
+            except (orjson.JSONDecodeError, OSError):
+                existing_data = {}
 
             # Update notification state section
             existing_data["notification_state"] = {
-                "notified_updates": list(self._notified_updates),
-                "notified_errors": self._notified_errors,
-                "notified_orphaned_activities": list(
-                    self._notified_orphaned_activities
-                ),
+                "notified_updates": [
+                    f"{driver_id}:{version}" for driver_id, version in updates
+                ],
+                "notified_errors": errors,
+                "notified_orphaned_activities": orphaned,
             }
             existing_data["version"] = "1.0"
 
-            # Ensure directory exists
-            os.makedirs(os.path.dirname(MANAGER_DATA_FILE), exist_ok=True)
-
-            # Write to disk
-            with open(MANAGER_DATA_FILE, "w", encoding="utf-8") as f:
-                json.dump(existing_data, f, indent=2)
+            # Write to disk atomically, a crash never leaves a truncated file
+            atomic_write_json(MANAGER_DATA_FILE, existing_data)
+            self._saved_state_hash = state_hash
             _LOG.debug("Saved notification state to %s", MANAGER_DATA_FILE)
         except OSError as e:
             _LOG.error("Failed to save notification state: %s", e)
 
+    def _schedule_save(self) -> None:
+        """
+        Save the notification state after SAVE_DELAY seconds.
+
+        Changes made in the meantime are written together. A timer thread
+        is used because callers run on the driver loop as well as in web
+        server threads, some without an event loop.
+        """
+        with self._save_lock:
+            if self._save_timer is None:
+                self._save_timer = threading.Timer(SAVE_DELAY, self.flush)
+                self._save_timer.daemon = True
+                self._save_timer.start()
+
+    def flush(self) -> None:
+        """Write pending notification state changes to disk now."""
+        with self._save_lock:
+            timer, self._save_timer = self._save_timer, None
+        if timer is None:
+            return
+        timer.cancel()
+        with self._write_lock:
+            self._save_notification_state()
+
     def _load_settings(self) -> NotificationSettings:
-        """Load current notification settings."""
-        return NotificationSettings.load()
+        """
+        Load current notification settings.
+
+        The settings are reused for SETTINGS_CACHE_TTL seconds, or until
+        invalidate_settings_cache() is called.
+        """
+        cached = self._settings_cache
+        if cached is not None and time.monotonic() - cached[0] < SETTINGS_CACHE_TTL:
+            return cached[1]
+
+        settings = NotificationSettings.load()
+        self._settings_cache = (time.monotonic(), settings)
+        return settings
+
+    async def _load_settings_async(self) -> NotificationSettings:
+        """Load current notification settings, reading the file in a worker thread."""
+        cached = self._settings_cache
+        if cached is not None and time.monotonic() - cached[0] < SETTINGS_CACHE_TTL:
+            return cached[1]
+        return await asyncio.to_thread(self._load_settings)
+
+    def invalidate_settings_cache(self) -> None:
+        """Forget the cached notification settings, e.g. after they were saved."""
+        self._settings_cache = None
 
     def _should_notify(self, settings: NotificationSettings) -> bool:
         """Check if any notification provider is enabled."""
@@ -120,27 +253,22 @@ class NotificationManager:
             current_version,
             latest_version,
         )
-        settings = self._load_settings()
+        settings = await self._load_settings_async()
+        any_enabled = self._should_notify(settings)
+        trigger_enabled = settings.triggers.integration_update_available
         _LOG.debug(
             "Settings loaded: any_enabled=%s, trigger_enabled=%s",
-            self._should_notify(settings),
-            settings.triggers.integration_update_available,
+            any_enabled,
+            trigger_enabled,
         )
-        if (
-            not self._should_notify(settings)
-            or not settings.triggers.integration_update_available
-        ):
+        if not any_enabled or not trigger_enabled:
             _LOG.info("Notification skipped: provider or trigger not enabled")
             return
 
         # Only notify once per version
-        notification_key = f"{driver_id}:{latest_version}"
-        _LOG.debug(
-            "Checking notification key: %s, already notified: %s",
-            notification_key,
-            notification_key in self._notified_updates,
-        )
+        notification_key = (driver_id, latest_version)
         if notification_key in self._notified_updates:
+            self._notified_updates.move_to_end(notification_key)
             _LOG.info("Notification already sent for this version")
             return
 
@@ -148,12 +276,18 @@ class NotificationManager:
         message = f"{integration_name} can be updated from {current_version} to {latest_version}"
 
         _LOG.info("Sending notification: title='%s', message='%s'", title, message)
+        # Claim the key before sending so an overlapping check for the same
+        # version is suppressed; it is released again if the send fails.
+        self._notified_updates[notification_key] = None
+        if len(self._notified_updates) > MAX_NOTIFIED_UPDATES:
+            self._notified_updates.popitem(last=False)
+        self._schedule_save()  # Persist to disk
         try:
             await self._service.send_all(settings, title, message)
-            self._notified_updates.add(notification_key)
-            self._save_notification_state()  # Persist to disk
             _LOG.info("Sent update notification for %s", integration_name)
         except Exception as e:
+            self._notified_updates.pop(notification_key, None)
+            self._schedule_save()
             _LOG.error("Failed to send update notification: %s", e)
 
     async def notify_new_integration_in_registry(
@@ -164,7 +298,7 @@ class NotificationManager:
 
         :param integration_names: List of new integration names
         """
-        settings = self._load_settings()
+        settings = await self._load_settings_async()
         if (
             not self._should_notify(settings)
             or not settings.triggers.new_integration_in_registry
@@ -191,7 +325,7 @@ class NotificationManager:
         :param integration_name: Name of the integration
         :param state: Current state
         """
-        settings = self._load_settings()
+        settings = await self._load_settings_async()
         if (
             not self._should_notify(settings)
             or not settings.triggers.integration_error_state
@@ -199,7 +333,8 @@ class NotificationManager:
             return
 
         # Only notify if this is a new error or the error state changed
-        if self._notified_errors.get(driver_id) == state:
+        previous_state = self._notified_errors.get(driver_id)
+        if previous_state == state:
             return
 
         title = "Integration Error"
@@ -208,12 +343,17 @@ class NotificationManager:
         _LOG.debug(
             "Sending error notification: title='%s', message='%s'", title, message
         )
+        self._notified_errors[driver_id] = state
+        self._schedule_save()  # Persist to disk
         try:
             await self._service.send_all(settings, title, message, priority=1)
-            self._notified_errors[driver_id] = state
-            self._save_notification_state()  # Persist to disk
             _LOG.info("Sent error state notification for %s", integration_name)
         except Exception as e:
+            if previous_state is None:
+                self._notified_errors.pop(driver_id, None)
+            else:
+                self._notified_errors[driver_id] = previous_state
+            self._schedule_save()
             _LOG.error("Failed to send error state notification: %s", e)
 
     def clear_error_state(self, driver_id: str) -> None:
@@ -225,7 +365,7 @@ class NotificationManager:
         :param driver_id: Driver ID of the integration
         """
         if self._notified_errors.pop(driver_id, None) is not None:
-            self._save_notification_state()  # Persist to disk
+            self._schedule_save()  # Persist to disk
 
     async def notify_orphaned_entities(
         self, activity_names: list[str], activity_ids: list[str]
@@ -243,7 +383,7 @@ class NotificationManager:
             activity_ids,
         )
 
-        settings = self._load_settings()
+        settings = await self._load_settings_async()
         if (
             not self._should_notify(settings)
             or not settings.triggers.orphaned_entities_detected
@@ -251,15 +391,18 @@ class NotificationManager:
             return
 
         # Filter to only new orphaned activities
-        new_activity_ids = set(activity_ids) - self._notified_orphaned_activities
+        new_activity_ids = {
+            aid for aid in activity_ids if aid not in self._notified_orphaned_activities
+        }
         if not new_activity_ids:
             _LOG.debug("No new orphaned activities to notify about")
             return
 
         # Get names for the new activities
-        id_to_name = {aid: name for aid, name in zip(activity_ids, activity_names)}
         new_activity_names = [
-            id_to_name[aid] for aid in new_activity_ids if aid in id_to_name
+            name
+            for aid, name in zip(activity_ids, activity_names)
+            if aid in new_activity_ids
         ]
 
         count = len(new_activity_names)
@@ -274,13 +417,15 @@ class NotificationManager:
             title,
             message,
         )
+        # Update tracked activities
+        self._notified_orphaned_activities.update(new_activity_ids)
+        self._schedule_save()
         try:
             await self._service.send_all(settings, title, message, priority=1)
-            # Update tracked activities
-            self._notified_orphaned_activities.update(new_activity_ids)
-            self._save_notification_state()
             _LOG.info("Sent orphaned entities notification for %d activities", count)
         except Exception as e:
+            self._notified_orphaned_activities.difference_update(new_activity_ids)
+            self._schedule_save()
             _LOG.error("Failed to send orphaned entities notification: %s", e)
 
     def clear_orphaned_activities(self, activity_ids: list[str]) -> None:
@@ -295,7 +440,7 @@ class NotificationManager:
                 self._notified_orphaned_activities.discard(aid)
                 removed = True
         if removed:
-            self._save_notification_state()
+            self._schedule_save()
 
     def clear_update_notification(self, driver_id: str, version: str) -> None:
         """
@@ -306,10 +451,10 @@ class NotificationManager:
         :param driver_id: Driver ID of the integration
         :param version: Version that was updated to
         """
-        notification_key = f"{driver_id}:{version}"
+        notification_key = (driver_id, version)
         if notification_key in self._notified_updates:
-            self._notified_updates.discard(notification_key)
-            self._save_notification_state()  # Persist to disk
+            del self._notified_updates[notification_key]
+            self._schedule_save()  # Persist to disk
 
     def update_registry_count(
         self, integration_data: list[tuple[str, str]]
@@ -322,7 +467,9 @@ class NotificationManager:
         """
         settings = self._load_settings()
         current_ids = {item[0] for item in integration_data}
-        known_ids = set(settings._known_integration_ids)
+        known_ids = settings._known_integration_ids
+        if current_ids == known_ids:
+            return []
 
         # Find new integrations - but only notify if we had known integrations before
         # (skip notification on first run when known_ids is empty)
@@ -337,23 +484,22 @@ class NotificationManager:
             id_to_name = {item[0]: item[1] for item in integration_data}
             new_names = [id_to_name[new_id] for new_id in new_ids]
 
-            # Update the stored list of known IDs
-            settings._known_integration_ids = list(current_ids)
+            # Update the stored set of known IDs
+            settings._known_integration_ids = current_ids
             settings._last_registry_count = len(current_ids)
             settings.save()
 
             return new_names
 
         # Update tracking (first run or no new integrations)
-        if known_ids != current_ids:
-            settings._known_integration_ids = list(current_ids)
-            settings._last_registry_count = len(current_ids)
-            settings.save()
-            if not known_ids:
-                _LOG.debug(
-                    "First run: initialized registry tracking with %d integrations",
-                    len(current_ids),
-                )
+        settings._known_integration_ids = current_ids
+        settings._last_registry_count = len(current_ids)
+        settings.save()
+        if not known_ids:
+            _LOG.debug(
+                "First run: initialized registry tracking with %d integrations",
+                len(current_ids),
+            )
 
         return []
 
@@ -361,6 +507,9 @@ class NotificationManager:
 # Global notification manager instance
 _notification_manager: NotificationManager | None = None
 
+# Driver event loop notifications from other threads are sent on
+_notification_loop: asyncio.AbstractEventLoop | None = None
+
 
 def get_notification_manager() -> NotificationManager:
     """Get the global notification manager instance."""
@@ -370,22 +519,91 @@ def get_notification_manager() -> NotificationManager:
     return _notification_manager
 
 
+def set_notification_loop(loop: asyncio.AbstractEventLoop | None) -> None:
+    """
+    Set the driver event loop notifications from other threads are sent on.
+
+    Sending every notification on the one long-lived driver loop lets them
+    share its HTTP session, connections and DNS cache.
+
+    :param loop: The driver's event loop, None when it stops
+    """
+    global _notification_loop
+    _notification_loop = loop
+
+
+def _get_notification_loop() -> asyncio.AbstractEventLoop | None:
+    """Get the driver event loop if it is running."""
+    loop = _notification_loop
+    if loop is None or loop.is_closed() or not loop.is_running():
+        return None
+    return loop
+
+
+async def _run_and_close_session(coro: Coroutine[Any, Any, Any]) -> Any:
+    """Await a notification coroutine, then close its loop's HTTP session."""
+    try:
+        return await coro
+    finally:
+        await close_session()
+
+
+def _log_send_error(future: concurrent.futures.Future) -> None:
+    """Log a notification that failed on the driver loop."""
+    if not future.cancelled() and future.exception() is not None:
+        _LOG.error("Failed to send notification: %s", future.exception())
+
+
+def run_notification_sync(coro: Coroutine[Any, Any, Any]) -> Any:
+    """
+    Run a notification coroutine from synchronous code and return its result.
+
+    The coroutine runs on the driver loop when it is running, otherwise on a
+    temporary event loop. Must not be called from the driver loop itself.
+
+    :param coro: Notification coroutine
+    :return: Result of the coroutine
+    """
+    loop = _get_notification_loop()
+    if loop is None:
+        return asyncio.run(_run_and_close_session(coro))
+    future = asyncio.run_coroutine_threadsafe(coro, loop)
+    try:
+        return future.result(NOTIFICATION_RESULT_TIMEOUT)
+    except concurrent.futures.TimeoutError:
+        future.cancel()
+        raise
+
+
 def send_notification_sync(coro_func, *args: Any, **kwargs: Any) -> None:
     """
     Helper to send notifications from synchronous code.
 
+    Without a running loop in this thread, the notification is handed to the
+    driver loop and sent in the background.
+
     :param coro_func: Async notification method to call
     :param args: Positional arguments
     :param kwargs: Keyword arguments
     """
     try:
-        # Try to get the current event loop
+        # Try to get the current event loop. The RuntimeError costs little next
+        # to a notification send. The answer is not cached per thread, since a
+        # thread can run a loop on one call and not on the next, and the private
+        # asyncio._get_running_loop() is not part of the supported API.
         try:
             loop = asyncio.get_running_loop()
             # We're in an async context, create a task
             loop.create_task(coro_func(*args, **kwargs))
         except RuntimeError:
-            # No running loop, use asyncio.run()
-            asyncio.run(coro_func(*args, **kwargs))
+            driver_loop = _get_notification_loop()
+            if driver_loop is not None:
+                future = asyncio.run_coroutine_threadsafe(
+                    coro_func(*args, **kwargs), driver_loop
+                )
+                future.add_done_callback(_log_send_error)
+            else:
+                # No driver loop (web server on its own), use asyncio.run()
+                asyncio.run(_run_and_close_session(coro_func(*args, **kwargs)))
     except Exception as e:
         _LOG.error("Failed to send notification: %s", e)
@@ -5,10 +5,17 @@ from __future__ import annotations
 import asyncio
 import logging
 import ssl
+import weakref
 from typing import Any
 
 import aiohttp
 import certifi
+import orjson
+
+try:
+    import aiodns
+except ImportError:  # Optional speedup, DNS lookups fall back to a thread pool
+    aiodns = None
 
 from notification_settings import (
     DiscordNotificationConfig,
@@ -20,12 +27,66 @@ from notification_settings import (
 
 _LOG = logging.getLogger(__name__)
 
+# Seconds resolved provider host names are cached
+DNS_CACHE_TTL = 900
+
+PUSHOVER_API_URL = "https://api.pushover.net/1/messages.json"
+
+
+# SSL context with certifi certificates for HTTPS requests, loaded once
+_SSL_CONTEXT: ssl.SSLContext = ssl.create_default_context(cafile=certifi.where())
+
+
+# Notification sessions, one per event loop: sends run on the driver loop and
+# from web server threads under their own asyncio.run() loops
+_SESSIONS: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, aiohttp.ClientSession
+] = weakref.WeakKeyDictionary()
+
+
+def _json_dumps(obj: Any) -> str:
+    """Serialize JSON request bodies with orjson."""
+    return orjson.dumps(obj).decode("utf-8")
+
+
+async def _get_session() -> aiohttp.ClientSession:
+    """
+    Get or create the HTTP session shared by all notification sends.
+
+    Reusing the session keeps connections to the notification providers
+    alive between sends instead of a new TCP and TLS handshake each time.
+    """
+    loop = asyncio.get_running_loop()
+    session = _SESSIONS.get(loop)
+    if session is None or session.closed:
+        connector = aiohttp.TCPConnector(
+            ssl=_SSL_CONTEXT,
+            limit=100,
+            limit_per_host=10,
+            # Keep idle provider connections open between notifications
+            keepalive_timeout=75,
+            resolver=(
+                aiohttp.AsyncResolver()
+                if aiodns is not None
+                else aiohttp.ThreadedResolver()
+            ),
+            ttl_dns_cache=DNS_CACHE_TTL,
+            enable_cleanup_closed=True,
+        )
+        session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=10),
+            json_serialize=_json_dumps,
+        )
+        _SESSIONS[loop] = session
+    return session
+
 
-# Create SSL context with certifi certificates for HTTPS requests
-def _get_ssl_context() -> ssl.SSLContext:
-    """Get SSL context with certifi certificates."""
-    ssl_context = ssl.create_default_context(cafile=certifi.where())
-    return ssl_context
+async def close_session() -> None:
+    """Close the notification session of the running event loop."""
+    session = _SESSIONS.pop(asyncio.get_running_loop(), None)
+    if session and not session.closed:
+        await session.close()
 
 
 class NotificationService:
@@ -54,12 +115,6 @@ class NotificationService:
             _LOG.warning("Home Assistant notifications not properly configured")
             return False
 
-        url = f"{config.url.rstrip('/')}/api/services/notify/notify"
-        headers = {
-            "Authorization": f"Bearer {config.token}",
-            "Content-Type": "application/json",
-        }
-
         payload = {
             "title": title,
             "message": message,
@@ -68,21 +123,19 @@ class NotificationService:
             payload["data"] = data
 
         try:
-            ssl_context = _get_ssl_context()
-            connector = aiohttp.TCPConnector(ssl=ssl_context)
-            async with aiohttp.ClientSession(connector=connector) as session:
-                async with session.post(
-                    url, headers=headers, json=payload, timeout=10
-                ) as resp:
-                    if resp.status == 200:
-                        _LOG.info("Notification sent to Home Assistant successfully")
-                        return True
-                    _LOG.error(
-                        "Failed to send Home Assistant notification: %s %s",
-                        resp.status,
-                        await resp.text(),
-                    )
-                    return False
+            session = await _get_session()
+            async with session.post(
+                config.endpoint_url, headers=config.request_headers, json=payload
+            ) as resp:
+                if resp.status == 200:
+                    _LOG.info("Notification sent to Home Assistant successfully")
+                    return True
+                _LOG.error(
+                    "Failed to send Home Assistant notification: %s %s",
+                    resp.status,
+                    await resp.text(),
+                )
+                return False
         except Exception as e:
             _LOG.error("Error sending Home Assistant notification: %s", e)
             return False
@@ -110,34 +163,28 @@ class NotificationService:
             _LOG.warning("Webhook notifications not properly configured")
             return False
 
-        headers = {"Content-Type": "application/json"}
-        if config.headers:
-            headers.update(config.headers)
-
+        # Fields from data override the defaults, timestamp included
         payload = {
             "title": title,
             "message": message,
-            "timestamp": data.get("timestamp") if data else None,
+            "timestamp": None,
+            **(data or {}),
         }
-        if data:
-            payload.update(data)
 
         try:
-            ssl_context = _get_ssl_context()
-            connector = aiohttp.TCPConnector(ssl=ssl_context)
-            async with aiohttp.ClientSession(connector=connector) as session:
-                async with session.post(
-                    config.url, headers=headers, json=payload, timeout=10
-                ) as resp:
-                    if resp.status in (200, 201, 202, 204):
-                        _LOG.info("Notification sent via webhook successfully")
-                        return True
-                    _LOG.error(
-                        "Failed to send webhook notification: %s %s",
-                        resp.status,
-                        await resp.text(),
-                    )
-                    return False
+            session = await _get_session()
+            async with session.post(
+                config.url, headers=config.request_headers, json=payload
+            ) as resp:
+                if resp.status in (200, 201, 202, 204):
+                    _LOG.info("Notification sent via webhook successfully")
+                    return True
+                _LOG.error(
+                    "Failed to send webhook notification: %s %s",
+                    resp.status,
+                    await resp.text(),
+                )
+                return False
         except Exception as e:
             _LOG.error("Error sending webhook notification: %s", e)
             return False
@@ -165,7 +212,6 @@ class NotificationService:
             _LOG.warning("Pushover notifications not properly configured")
             return False
 
-        url = "https://api.pushover.net/1/messages.json"
         payload = {
             "token": config.app_token,
             "user": config.user_key,
@@ -175,21 +221,19 @@ class NotificationService:
         }
 
         try:
-            ssl_context = _get_ssl_context()
-            connector = aiohttp.TCPConnector(ssl=ssl_context)
-            async with aiohttp.ClientSession(connector=connector) as session:
-                async with session.post(url, data=payload, timeout=10) as resp:
-                    if resp.status == 200:
-                        result = await resp.json()
-                        if result.get("status") == 1:
-                            _LOG.info("Notification sent via Pushover successfully")
-                            return True
-                    _LOG.error(
-                        "Failed to send Pushover notification: %s %s",
-                        resp.status,
-                        await resp.text(),
-                    )
-                    return False
+            session = await _get_session()
+            async with session.post(PUSHOVER_API_URL, data=payload) as resp:
+                if resp.status == 200:
+                    result = await resp.json()
+                    if result.get("status") == 1:
+                        _LOG.info("Notification sent via Pushover successfully")
+                        return True
+                _LOG.error(
+                    "Failed to send Pushover notification: %s %s",
+                    resp.status,
+                    await resp.text(),
+                )
+                return False
         except Exception as e:
             _LOG.error("Error sending Pushover notification: %s", e)
             return False
@@ -219,8 +263,6 @@ class NotificationService:
             _LOG.warning("ntfy notifications not properly configured")
             return False
 
-        url = f"{config.server.rstrip('/')}/{config.topic}"
-
         # Ensure priority is valid (1-5)
         priority = max(1, min(5, priority))
 
@@ -236,21 +278,19 @@ class NotificationService:
             headers["Authorization"] = f"Bearer {config.token}"
 
         try:
-            ssl_context = _get_ssl_context()
-            connector = aiohttp.TCPConnector(ssl=ssl_context)
-            async with aiohttp.ClientSession(connector=connector) as session:
-                async with session.post(
-                    url, headers=headers, data=message.encode("utf-8"), timeout=10
-                ) as resp:
-                    if resp.status == 200:
-                        _LOG.info("Notification sent via ntfy successfully")
-                        return True
-                    _LOG.error(
-                        "Failed to send ntfy notification: %s %s",
-                        resp.status,
-                        await resp.text(),
-                    )
-                    return False
+            session = await _get_session()
+            async with session.post(
+                config.topic_url, headers=headers, data=message.encode("utf-8")
+            ) as resp:
+                if resp.status == 200:
+                    _LOG.info("Notification sent via ntfy successfully")
+                    return True
+                _LOG.error(
+                    "Failed to send ntfy notification: %s %s",
+                    resp.status,
+                    await resp.text(),
+                )
+                return False
         except Exception as e:
             _LOG.error("Error sending ntfy notification: %s", e)
             return False
@@ -292,21 +332,17 @@ class NotificationService:
         }
 
         try:
-            ssl_context = _get_ssl_context()
-            connector = aiohttp.TCPConnector(ssl=ssl_context)
-            async with aiohttp.ClientSession(connector=connector) as session:
-                async with session.post(
-                    config.webhook_url, json=payload, timeout=10
-                ) as resp:
-                    if resp.status == 204:
-                        _LOG.info("Notification sent to Discord successfully")
-                        return True
-                    _LOG.error(
-                        "Failed to send Discord notification: %s %s",
-                        resp.status,
-                        await resp.text(),
-                    )
-                    return False
+            session = await _get_session()
+            async with session.post(config.webhook_url, json=payload) as resp:
+                if resp.status == 204:
+                    _LOG.info("Notification sent to Discord successfully")
+                    return True
+                _LOG.error(
+                    "Failed to send Discord notification: %s %s",
+                    resp.status,
+                    await resp.text(),
+                )
+                return False
         except Exception as e:
             _LOG.error("Error sending Discord notification: %s", e)
             return False
@@ -322,6 +358,10 @@ class NotificationService:
         """
         Send notification to all enabled providers.
 
+        Providers are sent to concurrently, so total latency is bounded by the
+        slowest provider; a failing provider is logged and reported as False
+        without affecting the others.
+
         Args:
             settings: NotificationSettings instance
             title: Notification title
@@ -334,42 +374,19 @@ class NotificationService:
         """
         results = {}
 
+        # Extra argument each sender takes after title and message
+        extras = {"data": data, "priority": priority}
         tasks = []
         providers = []
-
-        if settings.home_assistant.enabled:
-            tasks.append(
-                NotificationService.send_home_assistant(
-                    settings.home_assistant, title, message, data
-                )
-            )
-            providers.append("home_assistant")
-
-        if settings.webhook.enabled:
-            tasks.append(
-                NotificationService.send_webhook(settings.webhook, title, message, data)
-            )
-            providers.append("webhook")
-
-        if settings.pushover.enabled:
-            tasks.append(
-                NotificationService.send_pushover(
-                    settings.pushover, title, message, priority
-                )
-            )
-            providers.append("pushover")
-
-        if settings.ntfy.enabled:
-            tasks.append(
-                NotificationService.send_ntfy(settings.ntfy, title, message, priority)
-            )
-            providers.append("ntfy")
-
-        if settings.discord.enabled:
-            tasks.append(
-                NotificationService.send_discord(settings.discord, title, message)
-            )
-            providers.append("discord")
+        for provider, sender, extra in _PROVIDERS:
+            config = getattr(settings, provider)
+            if not config.enabled:
+                continue
+            if extra is None:
+                tasks.append(sender(config, title, message))
+            else:
+                tasks.append(sender(config, title, message, extras[extra]))
+            providers.append(provider)
 
         if tasks:
             task_results = await asyncio.gather(*tasks, return_exceptions=True)
@@ -385,3 +402,13 @@ class NotificationService:
             _LOG.info("No notification providers enabled")
 
         return results
+
+
+# Notification providers as (settings attribute, sender, extra argument name)
+_PROVIDERS = (
+    ("home_assistant", NotificationService.send_home_assistant, "data"),
+    ("webhook", NotificationService.send_webhook, "data"),
+    ("pushover", NotificationService.send_pushover, "priority"),
+    ("ntfy", NotificationService.send_ntfy, "priority"),
+    ("discord", NotificationService.send_discord, None),
+)
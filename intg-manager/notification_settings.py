@@ -2,13 +2,15 @@
 
 from __future__ import annotations
 
-import json
 import logging
 import os
-from dataclasses import asdict, dataclass, field
+from dataclasses import dataclass, field
+from functools import cached_property
 from typing import Any
 
-from const import MANAGER_DATA_FILE
+import orjson
+
+from const import MANAGER_DATA_FILE, atomic_write_json
 
 _LOG = logging.getLogger(__name__)
 
@@ -28,6 +30,20 @@ class HomeAssistantNotificationConfig:
     token: str = ""
     """Long-lived access token for Home Assistant API."""
 
+    # Configs are replaced rather than modified, so derived values are cached
+    @cached_property
+    def endpoint_url(self) -> str:
+        """URL of the Home Assistant notify service."""
+        return f"{self.url.rstrip('/')}/api/services/notify/notify"
+
+    @cached_property
+    def request_headers(self) -> dict[str, str]:
+        """HTTP headers for Home Assistant API requests."""
+        return {
+            "Authorization": f"Bearer {self.token}",
+            "Content-Type": "application/json",
+        }
+
 
 @dataclass
 class WebhookNotificationConfig:
@@ -42,6 +58,11 @@ class WebhookNotificationConfig:
     headers: dict[str, str] = field(default_factory=dict)
     """Custom HTTP headers to include in requests."""
 
+    @cached_property
+    def request_headers(self) -> dict[str, str]:
+        """HTTP headers for webhook requests, custom headers included."""
+        return {"Content-Type": "application/json", **(self.headers or {})}
+
 
 @dataclass
 class PushoverNotificationConfig:
@@ -73,6 +94,11 @@ class NtfyNotificationConfig:
     token: str = ""
     """Optional access token for protected topics."""
 
+    @cached_property
+    def topic_url(self) -> str:
+        """URL notifications are published to."""
+        return f"{self.server.rstrip('/')}/{self.topic}"
+
 
 @dataclass
 class DiscordNotificationConfig:
@@ -142,45 +168,42 @@ class NotificationSettings:
     _last_registry_count: int = 0
     """Internal: Last known count of integrations in registry."""
 
-    _known_integration_ids: list[str] = field(default_factory=list)
-    """Internal: List of known integration IDs from registry."""
+    _known_integration_ids: set[str] = field(default_factory=set)
+    """Internal: Set of known integration IDs from registry."""
 
     @classmethod
     def load(cls) -> NotificationSettings:
         """Load notification settings from manager.json or return defaults."""
-        if os.path.exists(NOTIFICATION_SETTINGS_FILE):
-            try:
-                with open(NOTIFICATION_SETTINGS_FILE, encoding="utf-8") as f:
-                    file_data = json.load(f)
-                    # Get notification_settings section from manager.json
-                    data = file_data.get("notification_settings", {})
-
-                    if not data:
-                        # Try legacy location for migration
-                        legacy_file = os.path.expanduser(
-                            "~/.ucintg/notification_settings.json"
-                        )
-                        if os.path.exists(legacy_file):
-                            _LOG.info(
-                                "Migrating notification settings from legacy location"
-                            )
-                            with open(legacy_file, encoding="utf-8") as lf:
-                                data = json.load(lf)
-                            # Save to new location and return
-                            settings = cls._parse_settings_data(data)
-                            settings.save()
-                            # Clean up legacy file
-                            try:
-                                os.remove(legacy_file)
-                                _LOG.info("Removed legacy notification settings file")
-                            except OSError:
-                                pass
-                            return settings
-                        return cls()
-
-                    return cls._parse_settings_data(data)
-            except (json.JSONDecodeError, OSError) as e:
-                _LOG.warning("Failed to load notification settings: %s", e)
+        try:
+            with open(NOTIFICATION_SETTINGS_FILE, "rb") as f:
+                file_data = orjson.loads(f.read())
+            # Get notification_settings section from manager.json
+            data = file_data.get("notification_settings", {})
+
+            if not data:
+                # Try legacy location for migration
+                legacy_file = os.path.expanduser("~/.ucintg/notification_settings.json")
+                if os.path.exists(legacy_file):
+                    _LOG.info("Migrating notification settings from legacy location")
+                    with open(legacy_file, "rb") as lf:
+                        data = orjson.loads(lf.read())
+                    # Save to new location and return
+                    settings = cls._parse_settings_data(data)
+                    settings.save()
+                    # Clean up legacy file
+                    try:
+                        os.remove(legacy_file)
+                        _LOG.info("Removed legacy notification settings file")
+                    except OSError:
+                        pass
+                    return settings
+                return cls()
+
+            return cls._parse_settings_data(data)
+        except FileNotFoundError:
+            pass
+        except (orjson.JSONDecodeError, OSError) as e:
+            _LOG.warning("Failed to load notification settings: %s", e)
         return cls()
 
     @classmethod
@@ -201,43 +224,90 @@ class NotificationSettings:
             data["discord"] = DiscordNotificationConfig(**data["discord"])
         if "triggers" in data:
             data["triggers"] = NotificationTriggers(**data["triggers"])
+        if "_known_integration_ids" in data:
+            data["_known_integration_ids"] = set(data["_known_integration_ids"])
 
         return cls(**data)
 
     def save(self) -> None:
         """Save notification settings to manager.json."""
         try:
-            os.makedirs(os.path.dirname(NOTIFICATION_SETTINGS_FILE), exist_ok=True)
-
             # Load existing data to preserve other sections
-            existing_data = {}
-            if os.path.exists(NOTIFICATION_SETTINGS_FILE):
-                try:
-                    with open(NOTIFICATION_SETTINGS_FILE, "r", encoding="utf-8") as f:
-                        existing_data = json.load(f)
-                except (json.JSONDecodeError, OSError):
-                    pass
+            try:
+                with open(NOTIFICATION_SETTINGS_FILE, "rb") as f:
+                    existing_data = orjson.loads(f.read())
+            except (orjson.JSONDecodeError, OSError):
+                existing_data = {}
+
+            # Nothing to write if the file already holds these settings
+            settings_data = self.to_dict()
+            if (
+                existing_data.get("notification_settings") == settings_data
+                and existing_data.get("version") == "1.0"
+            ):
+                _LOG.debug("Notification settings unchanged, skipping save")
+                return
 
             # Update notification_settings section
-            existing_data["notification_settings"] = self.to_dict()
+            existing_data["notification_settings"] = settings_data
             existing_data["version"] = "1.0"
 
-            with open(NOTIFICATION_SETTINGS_FILE, "w", encoding="utf-8") as f:
-                json.dump(existing_data, f, indent=2)
+            # Write to disk atomically, a crash never leaves a truncated file
+            atomic_write_json(NOTIFICATION_SETTINGS_FILE, existing_data)
             _LOG.info("Notification settings saved to %s", NOTIFICATION_SETTINGS_FILE)
         except OSError as e:
             _LOG.error("Failed to save notification settings: %s", e)
 
     def to_dict(self) -> dict[str, Any]:
         """Convert settings to dictionary."""
-        return asdict(self)
+        # Built by hand: asdict() deep-copies every value through reflection
+        ha, webhook, pushover = self.home_assistant, self.webhook, self.pushover
+        ntfy, triggers = self.ntfy, self.triggers
+        return {
+            "home_assistant": {
+                "enabled": ha.enabled,
+                "url": ha.url,
+                "token": ha.token,
+            },
+            "webhook": {
+                "enabled": webhook.enabled,
+                "url": webhook.url,
+                "headers": dict(webhook.headers or {}),
+            },
+            "pushover": {
+                "enabled": pushover.enabled,
+                "user_key": pushover.user_key,
+                "app_token": pushover.app_token,
+            },
+            "ntfy": {
+                "enabled": ntfy.enabled,
+                "server": ntfy.server,
+                "topic": ntfy.topic,
+                "token": ntfy.token,
+            },
+            "discord": {
+                "enabled": self.discord.enabled,
+                "webhook_url": self.discord.webhook_url,
+            },
+            "triggers": {
+                "integration_update_available": triggers.integration_update_available,
+                "new_integration_in_registry": triggers.new_integration_in_registry,
+                "integration_error_state": triggers.integration_error_state,
+                "orphaned_entities_detected": triggers.orphaned_entities_detected,
+            },
+            "_last_registry_count": self._last_registry_count,
+            "_known_integration_ids": sorted(self._known_integration_ids),
+        }
 
     def is_any_enabled(self) -> bool:
         """Check if any notification provider is enabled."""
-        return (
-            self.home_assistant.enabled
-            or self.webhook.enabled
-            or self.pushover.enabled
-            or self.ntfy.enabled
-            or self.discord.enabled
+        return any(
+            config.enabled
+            for config in (
+                self.home_assistant,
+                self.webhook,
+                self.pushover,
+                self.ntfy,
+                self.discord,
+            )
         )
@@ -7,8 +7,10 @@ It provides methods to query integrations, drivers, and system status.
 :license: Mozilla Public License Version 2.0, see LICENSE for more details.
 """
 
+import asyncio
 import logging
 import ssl
+from collections.abc import AsyncIterator
 from typing import Any
 
 import aiohttp
@@ -17,10 +19,52 @@ import certifi
 _LOG = logging.getLogger(__name__)
 
 
+# Connection pool shared by all Remote API clients and the loop it belongs to
+_SHARED_CONNECTOR: aiohttp.TCPConnector | None = None
+_SHARED_CONNECTOR_LOOP: asyncio.AbstractEventLoop | None = None
+
+
 class RemoteAPIError(Exception):
     """Exception raised when Remote API calls fail."""
 
 
+def _get_shared_connector() -> aiohttp.TCPConnector:
+    """
+    Get or create the connection pool shared by all Remote API clients.
+
+    Clients keep their own sessions (each with its own credentials), but
+    pool keep-alive connections, DNS lookups and the SSL context here.
+    """
+    global _SHARED_CONNECTOR, _SHARED_CONNECTOR_LOOP
+
+    loop = asyncio.get_running_loop()
+    if (
+        _SHARED_CONNECTOR is None
+        or _SHARED_CONNECTOR.closed
+        or _SHARED_CONNECTOR_LOOP is not loop
+    ):
+        # Create SSL context with certifi certificates for HTTPS support
+        ssl_context = ssl.create_default_context(cafile=certifi.where())
+        _SHARED_CONNECTOR = aiohttp.TCPConnector(
+            ssl=ssl_context,
+            limit=64,
+            limit_per_host=8,
+            keepalive_timeout=60,
+        )
+        _SHARED_CONNECTOR_LOOP = loop
+    return _SHARED_CONNECTOR
+
+
+async def close_shared_connector() -> None:
+    """Close the connection pool shared by all Remote API clients."""
+    global _SHARED_CONNECTOR, _SHARED_CONNECTOR_LOOP
+
+    if _SHARED_CONNECTOR and not _SHARED_CONNECTOR.closed:
+        await _SHARED_CONNECTOR.close()
+    _SHARED_CONNECTOR = None
+    _SHARED_CONNECTOR_LOOP = None
+
+
 class RemoteAPIClient:
     """
     Client for interacting with the Unfolded Circle Remote REST API.
@@ -67,21 +111,18 @@ class RemoteAPIClient:
             # Create timeout object explicitly to avoid context manager issues
             # when running from non-async context via run_coroutine_threadsafe
             timeout = aiohttp.ClientTimeout(total=30)
-            
-            # Create SSL context with certifi certificates for HTTPS support
-            ssl_context = ssl.create_default_context(cafile=certifi.where())
-            connector = aiohttp.TCPConnector(ssl=ssl_context)
 
             self._session = aiohttp.ClientSession(
                 headers=headers,
                 auth=auth,
                 timeout=timeout,
-                connector=connector,
+                connector=_get_shared_connector(),
+                connector_owner=False,
             )
         return self._session
 
     async def close(self) -> None:
-        """Close the HTTP session."""
+        """Close the HTTP session (the shared connection pool stays open)."""
         if self._session and not self._session.closed:
             await self._session.close()
 
@@ -126,7 +167,17 @@ class RemoteAPIClient:
         :return: List of integration instance dictionaries
         """
         _LOG.debug("Fetching integration instances")
-        return await self._request("GET", "/intg/instances")
+        return await self._request("GET", "/intg/instances?limit=100") or []
+
+    async def get_instance(self, instance_id: str) -> dict[str, Any]:
+        """
+        Get a single integration instance by ID.
+
+        :param instance_id: The integration instance identifier
+        :return: Integration instance dictionary
+        """
+        _LOG.debug("Fetching integration instance: %s", instance_id)
+        return await self._request("GET", f"/intg/instances/{instance_id}")
 
     async def get_driver(self, driver_id: str) -> dict[str, Any]:
         """
@@ -147,6 +198,64 @@ class RemoteAPIClient:
         _LOG.debug("Fetching all drivers")
         return await self._request("GET", "/intg/drivers?limit=100")
 
+    async def start_setup(
+        self, driver_id: str, reconfigure: bool = True
+    ) -> dict[str, Any]:
+        """
+        Start the integration setup flow.
+
+        POST /intg/setup with driver_id and reconfigure=true to begin configuration.
+
+        :param driver_id: The driver ID to configure
+        :param reconfigure: Whether this is a reconfiguration (default True)
+        :return: Confirmation response with driver_id, reconfigure, and state
+        :raises RemoteAPIError: If setup fails
+        """
+        payload = {
+            "driver_id": driver_id,
+            "reconfigure": reconfigure,
+            "setup_data": {},
+        }
+        return await self._request("POST", "/intg/setup", json=payload)
+
+    async def get_setup(self, driver_id: str) -> dict[str, Any]:
+        """
+        Get the current setup page for an integration.
+
+        :param driver_id: The driver ID being configured
+        :return: Setup response with require_user_action fields
+        :raises RemoteAPIError: If request fails
+        """
+        return await self._request("GET", f"/intg/setup/{driver_id}")
+
+    async def send_setup_input(
+        self, driver_id: str, input_values: dict[str, Any]
+    ) -> dict[str, Any]:
+        """
+        Send input values during the setup flow.
+
+        :param driver_id: The driver ID being configured
+        :param input_values: Dictionary of field IDs to values
+        :return: Next setup step response
+        :raises RemoteAPIError: If request fails
+        """
+        payload = {"input_values": input_values}
+        return await self._request("PUT", f"/intg/setup/{driver_id}", json=payload)
+
+    async def complete_setup(self, driver_id: str) -> bool:
+        """
+        Complete and clean up an integration setup flow.
+
+        :param driver_id: The driver ID to complete setup for
+        :return: True if successful
+        """
+        try:
+            await self._request("DELETE", f"/intg/setup/{driver_id}")
+            return True
+        except RemoteAPIError as e:
+            _LOG.warning("Failed to complete setup for %s: %s", driver_id, e)
+            return False
+
     async def get_log_services(self) -> list[dict[str, Any]]:
         """
         Get all available log services from the remote.
@@ -253,6 +362,44 @@ class RemoteAPIClient:
             _LOG.warning("Failed to check charging status: %s", e)
             return False
 
+    async def listen_events(
+        self, channels: list[str] | None = None
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Subscribe to the remote's WebSocket event stream.
+
+        Yields event messages until the connection is closed.
+
+        :param channels: Event channels to subscribe to (default: all)
+        :return: Async iterator of event message dictionaries
+        :raises RemoteAPIError: If the connection fails or is closed
+        """
+        session = await self._get_session()
+        url = f"ws://{self._address}:{self._port}/ws"
+
+        try:
+            async with session.ws_connect(
+                url, heartbeat=30, receive_timeout=None
+            ) as ws:
+                await ws.send_json(
+                    {
+                        "kind": "req",
+                        "id": 1,
+                        "msg": "subscribe_events",
+                        "msg_data": {"channels": channels or ["all"]},
+                    }
+                )
+                async for msg in ws:
+                    if msg.type != aiohttp.WSMsgType.TEXT:
+                        continue
+                    data = msg.json()
+                    if isinstance(data, dict) and data.get("kind") == "event":
+                        yield data
+        except (aiohttp.ClientError, ValueError) as e:
+            raise RemoteAPIError(f"Event stream error: {e}") from e
+
+        raise RemoteAPIError("Event stream closed")
+
     async def get_version(self) -> dict[str, Any]:
         """
         Get remote version information.
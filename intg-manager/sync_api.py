@@ -7,10 +7,12 @@ Uses the `requests` library instead of aiohttp to avoid async context issues.
 :license: Mozilla Public License Version 2.0, see LICENSE for more details.
 """
 
+import functools
 import json
 import logging
 import os
 import re
+import time
 from typing import Any
 from datetime import datetime
 import asyncio
@@ -25,9 +27,15 @@ from const import GITHUB_API_BASE, KNOWN_INTEGRATIONS_URL
 
 _LOG = logging.getLogger(__name__)
 
+# Owner and repository of a GitHub URL, ignoring ".git", sub-paths, query and fragment
+_GITHUB_URL_RE = re.compile(r"github\.com/([^/]+)/([^/?#]+?)(?:\.git)?(?:[/?#].*)?$")
+
 # Default timeout for all requests (connect, read)
 REQUEST_TIMEOUT = (10, 30)
 
+# Minimum seconds to back off after hitting the GitHub rate limit
+RATE_LIMIT_BACKOFF = 60
+
 
 class SyncAPIError(Exception):
     """Exception raised when API calls fail."""
@@ -61,6 +69,9 @@ class SyncRemoteClient:
         self._port = port
         self._base_url = f"http://{address}:{port}/api"
 
+        # Last setup page per driver_id with its ETag, for conditional GETs
+        self._setup_cache: dict[str, tuple[str, dict[str, Any]]] = {}
+
         # Set up session with auth and certifi certificates for HTTPS
         self._session = requests.Session()
         self._session.verify = certifi.where()  # Use certifi's certificate bundle
@@ -84,28 +95,45 @@ class SyncRemoteClient:
         :return: JSON response data
         :raises SyncAPIError: If the request fails
         """
+        response = self._request_response(method, endpoint, **kwargs)
+        if response.text:
+            return response.json()
+        return None
+
+    def _request_response(
+        self,
+        method: str,
+        endpoint: str,
+        **kwargs: Any,
+    ) -> requests.Response:
+        """
+        Make an HTTP request to the Remote API and return the raw response.
+
+        Error statuses raise like in _request(); other statuses, such as a
+        304 Not Modified for a conditional request, are left to the caller.
+
+        :param method: HTTP method (GET, POST, etc.)
+        :param endpoint: API endpoint (e.g., /intg/instances)
+        :param kwargs: Additional arguments for requests, e.g. extra headers
+        :return: The response
+        :raises SyncAPIError: If the request fails
+        """
         url = f"{self._base_url}{endpoint}"
         kwargs.setdefault("timeout", REQUEST_TIMEOUT)
 
         try:
             response = self._session.request(method, url, **kwargs)
-
-            if response.status_code == 401:
-                raise SyncAPIError("Authentication failed. Check PIN or API key.")
-            if response.status_code == 403:
-                raise SyncAPIError("Access forbidden. PIN may have changed.")
-            if response.status_code >= 400:
-                raise SyncAPIError(
-                    f"API error: {response.status_code} - {response.text}"
-                )
-
-            if response.text:
-                return response.json()
-            return None
-
         except requests.RequestException as e:
             raise SyncAPIError(f"Request failed: {e}") from e
 
+        if response.status_code == 401:
+            raise SyncAPIError("Authentication failed. Check PIN or API key.")
+        if response.status_code == 403:
+            raise SyncAPIError("Access forbidden. PIN may have changed.")
+        if response.status_code >= 400:
+            raise SyncAPIError(f"API error: {response.status_code} - {response.text}")
+        return response
+
     def test_connection(self) -> bool:
         """Test connectivity to the remote."""
         try:
@@ -356,6 +384,7 @@ class SyncRemoteClient:
             "reconfigure": reconfigure,
             "setup_data": {},
         }
+        self._setup_cache.pop(driver_id, None)
         return self._request("POST", "/intg/setup", json=payload)
 
     def get_setup(self, driver_id: str) -> dict[str, Any]:
@@ -364,11 +393,31 @@ class SyncRemoteClient:
 
         GET /intg/setup/{driver_id} to retrieve the setup form/choices.
 
+        If the remote returned an ETag for the previous page of this driver,
+        the request is sent with If-None-Match and a 304 reply reuses the
+        cached page. Any setup call that changes the flow drops the cache.
+
         :param driver_id: The driver ID being configured
         :return: Setup response with require_user_action fields
         :raises SyncAPIError: If request fails
         """
-        return self._request("GET", f"/intg/setup/{driver_id}")
+        cached = self._setup_cache.get(driver_id)
+        headers = {"If-None-Match": cached[0]} if cached else None
+
+        response = self._request_response(
+            "GET", f"/intg/setup/{driver_id}", headers=headers
+        )
+        if response.status_code == 304 and cached:
+            _LOG.debug("Setup page for %s not modified", driver_id)
+            return cached[1]
+
+        result = response.json() if response.text else None
+        etag = response.headers.get("ETag")
+        if etag and isinstance(result, dict):
+            self._setup_cache[driver_id] = (etag, result)
+        else:
+            self._setup_cache.pop(driver_id, None)
+        return result
 
     def send_setup_input(
         self, driver_id: str, input_values: dict[str, Any]
@@ -384,6 +433,7 @@ class SyncRemoteClient:
         :raises SyncAPIError: If request fails
         """
         payload = {"input_values": input_values}
+        self._setup_cache.pop(driver_id, None)
         return self._request("PUT", f"/intg/setup/{driver_id}", json=payload)
 
     def complete_setup(self, driver_id: str) -> bool:
@@ -395,6 +445,7 @@ class SyncRemoteClient:
         :param driver_id: The driver ID to complete setup for
         :return: True if successful
         """
+        self._setup_cache.pop(driver_id, None)
         try:
             self._request("DELETE", f"/intg/setup/{driver_id}")
             return True
@@ -571,26 +622,83 @@ class SyncGitHubClient:
                 "User-Agent": "uc-intg-manager",
             }
         )
+        # Last 200 response per (url, params) with an ETag, for revalidation
+        self._etag_cache: dict[tuple[str, tuple], tuple[str, requests.Response]] = {}
+        # Monotonic time until which requests are skipped after a rate limit
+        self._rate_limited_until = 0.0
+
+    @property
+    def is_throttled(self) -> bool:
+        """Whether requests are skipped because the rate limit was hit."""
+        return time.monotonic() < self._rate_limited_until
+
+    def _set_rate_limited(self, response: requests.Response) -> None:
+        """
+        Skip requests until the rate limit resets.
+
+        :param response: The rate limited response
+        """
+        now = time.time()
+        try:
+            reset = int(response.headers.get("X-RateLimit-Reset", "0"))
+        except ValueError:
+            reset = 0
+        self._rate_limited_until = (
+            max(reset, now + RATE_LIMIT_BACKOFF) - now + time.monotonic()
+        )
+
+    def _conditional_get(
+        self, url: str, params: dict[str, Any] | None = None
+    ) -> requests.Response:
+        """
+        GET a GitHub API URL, revalidating the previous response by its ETag.
+
+        A 304 Not Modified reply is answered with the cached 200 response, so
+        callers handle both the same way. A rate limited reply starts the
+        backoff reported by is_throttled.
+
+        :param url: API URL
+        :param params: Query parameters
+        :return: The response
+        :raises requests.RequestException: If the request fails
+        """
+        key = (url, tuple(sorted(params.items())) if params else ())
+        cached = self._etag_cache.get(key)
+        headers = {"If-None-Match": cached[0]} if cached else None
+
+        response = self._session.get(
+            url, params=params, headers=headers, timeout=REQUEST_TIMEOUT
+        )
+        if response.status_code == 304 and cached:
+            return cached[1]
+        if (
+            response.status_code == 403
+            and response.headers.get("X-RateLimit-Remaining") == "0"
+        ):
+            self._set_rate_limited(response)
+
+        etag = response.headers.get("ETag")
+        if response.status_code == 200 and etag:
+            self._etag_cache[key] = (etag, response)
+        return response
 
     @staticmethod
+    @functools.lru_cache(maxsize=256)
     def parse_github_url(home_page: str) -> tuple[str, str] | None:
         """Parse a GitHub URL to extract owner and repo."""
-        patterns = [
-            r"github\.com/([^/]+)/([^/]+?)(?:\.git)?(?:/.*)?$",
-            r"github\.com/([^/]+)/([^/]+)$",
-        ]
-        for pattern in patterns:
-            match = re.search(pattern, home_page)
-            if match:
-                return match.group(1), match.group(2).rstrip("/")
+        match = _GITHUB_URL_RE.search(home_page)
+        if match:
+            return match.group(1), match.group(2)
         return None
 
     def get_latest_release(self, owner: str, repo: str) -> dict[str, Any] | None:
         """Get the latest release for a repository."""
+        if self.is_throttled:
+            return None
         url = f"{GITHUB_API_BASE}/repos/{owner}/{repo}/releases/latest"
 
         try:
-            response = self._session.get(url, timeout=REQUEST_TIMEOUT)
+            response = self._conditional_get(url)
 
             # Check for rate limiting
             rate_limit_remaining = response.headers.get("X-RateLimit-Remaining")
@@ -640,11 +748,13 @@ class SyncGitHubClient:
         :param limit: Maximum number of releases to return (default 10)
         :return: List of release data dictionaries
         """
+        if self.is_throttled:
+            return []
         url = f"{GITHUB_API_BASE}/repos/{owner}/{repo}/releases"
         params = {"per_page": limit}
 
         try:
-            response = self._session.get(url, params=params, timeout=REQUEST_TIMEOUT)
+            response = self._conditional_get(url, params=params)
 
             # Check for rate limiting
             rate_limit_remaining = response.headers.get("X-RateLimit-Remaining")
@@ -675,11 +785,13 @@ class SyncGitHubClient:
         :param tag: Release tag (e.g., 'v1.0.0' or '1.0.0')
         :return: Release data or None if not found
         """
+        if self.is_throttled:
+            return None
         # GitHub API expects the tag as-is (with or without 'v' prefix)
         url = f"{GITHUB_API_BASE}/repos/{owner}/{repo}/releases/tags/{tag}"
 
         try:
-            response = self._session.get(url, timeout=REQUEST_TIMEOUT)
+            response = self._conditional_get(url)
 
             if response.status_code == 200:
                 return response.json()
@@ -771,7 +883,7 @@ class SyncGitHubClient:
         url = f"{GITHUB_API_BASE}/repos/{owner}/{repo}/tags"
 
         try:
-            response = self._session.get(url, timeout=REQUEST_TIMEOUT)
+            response = self._conditional_get(url)
 
             # Check for rate limiting
             if response.status_code == 403:
@@ -17,6 +17,7 @@ import os
 import sys
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
@@ -31,7 +32,11 @@ from notification_settings import (
 )
 from notification_settings import NotificationSettings, NotificationTriggers
 from notification_service import NotificationService
-from notification_manager import send_notification_sync, get_notification_manager
+from notification_manager import (
+    get_notification_manager,
+    run_notification_sync,
+    send_notification_sync,
+)
 from system_messages import get_system_messages_service
 
 import markdown
@@ -39,7 +44,9 @@ from flask import Flask, render_template, jsonify, request, send_file, Response
 from werkzeug.serving import make_server
 
 from backup_service import (
+    BackupStore,
     backup_integration,
+    backup_integrations_async,
     get_all_backups,
     delete_backup,
     backup_all_integrations,
@@ -47,6 +54,7 @@ from backup_service import (
 )
 from const import WEB_SERVER_PORT, Settings, API_DELAY, MANAGER_DATA_FILE
 from log_handler import get_log_entries, get_log_handler
+from remote_api import RemoteAPIClient
 from migration_service import extract_migration_mappings
 from sync_api import SyncRemoteClient, SyncGitHubClient, load_registry, SyncAPIError
 from packaging.version import Version, InvalidVersion
@@ -133,12 +141,15 @@ _cached_version_data: dict = {}
 _version_check_timestamp: str | None = None
 _cached_driver_ids: set = set()  # Track installed driver IDs to detect changes
 
+# Maximum number of GitHub release lookups run concurrently
+GITHUB_LOOKUP_CONCURRENCY = 4
+
 # Operation lock to prevent concurrent installs/upgrades
 _operation_in_progress: bool = False
 _operation_lock = threading.Lock()
 
 
-@dataclass
+@dataclass(slots=True)
 class IntegrationInfo:
     """Integration information for display."""
 
@@ -163,7 +174,7 @@ class IntegrationInfo:
     can_auto_update: bool = False  # Can do automated backup/restore (requires supports_backup and min version)
 
 
-@dataclass
+@dataclass(slots=True)
 class AvailableIntegration:
     """Available integration from registry."""
 
@@ -235,6 +246,64 @@ def _get_latest_release_for_update(owner: str, repo: str) -> dict[str, Any] | No
         return _github_client.get_latest_release(owner, repo)
 
 
+def _get_latest_releases_for_update(
+    repos: set[tuple[str, str]],
+) -> dict[tuple[str, str], dict[str, Any] | None]:
+    """
+    Get the latest releases of several repositories concurrently.
+
+    :param repos: Set of (owner, repo) tuples
+    :return: Release data (or None) keyed by (owner, repo)
+    """
+    if not repos:
+        return {}
+
+    def _lookup(owner_repo: tuple[str, str]) -> dict[str, Any] | None:
+        try:
+            return _get_latest_release_for_update(*owner_repo)
+        except Exception as e:
+            _LOG.debug("Failed to get release for %s/%s: %s", *owner_repo, e)
+            return None
+
+    with ThreadPoolExecutor(
+        max_workers=min(GITHUB_LOOKUP_CONCURRENCY, len(repos)),
+        thread_name_prefix="github",
+    ) as executor:
+        return dict(zip(repos, executor.map(_lookup, repos)))
+
+
+def _get_backup_driver_ids(
+    integrations: list[dict[str, Any]], registry: list[dict[str, Any]]
+) -> list[str]:
+    """
+    Get the driver IDs of installed integrations that support backup.
+
+    :param integrations: Installed integration instances
+    :param registry: Integrations registry
+    :return: Driver IDs that support backup and meet the version requirements
+    """
+    registry_by_driver_id = {}
+    for item in registry:
+        if item.get("driver_id"):
+            registry_by_driver_id[item["driver_id"]] = item
+        registry_by_driver_id[item["id"]] = item
+
+    driver_ids = []
+    for instance in integrations:
+        driver_id = instance.get("driver_id", "")
+        version = instance.get("version", "0.0.0")
+
+        # Check if this integration supports backup and meets version requirements
+        reg_item = registry_by_driver_id.get(driver_id)
+        if not reg_item:
+            continue
+
+        can_backup, _ = _can_backup_integration(driver_id, version, reg_item)
+        if can_backup:
+            driver_ids.append(driver_id)
+    return driver_ids
+
+
 def _refresh_version_cache() -> None:
     """
     Refresh the cached version information for all installed integrations.
@@ -247,6 +316,11 @@ def _refresh_version_cache() -> None:
     if not _remote_client or not _github_client:
         return
 
+    # Keep the cached versions until the GitHub rate limit resets
+    if _github_client.is_throttled:
+        _LOG.debug("GitHub API rate limited, skipping version cache refresh")
+        return
+
     try:
         _LOG.info("Refreshing version cache after update...")
 
@@ -255,25 +329,25 @@ def _refresh_version_cache() -> None:
         version_updates = {}
         current_driver_ids = set()
 
+        # Look up the latest releases of all GitHub hosted integrations at once
+        repos = {
+            integration.driver_id: parsed
+            for integration in integrations
+            if not integration.official
+            and integration.home_page
+            and "github.com" in integration.home_page
+            and (parsed := SyncGitHubClient.parse_github_url(integration.home_page))
+        }
+        releases = _get_latest_releases_for_update(set(repos.values()))
+
         for integration in integrations:
             current_driver_ids.add(integration.driver_id)
 
-            if integration.official:
-                continue
-
-            if not integration.home_page or "github.com" not in integration.home_page:
+            if integration.driver_id not in repos:
                 continue
 
-            # Small delay to avoid GitHub rate limiting
-            time.sleep(0.1)
-
             try:
-                parsed = SyncGitHubClient.parse_github_url(integration.home_page)
-                if not parsed:
-                    continue
-
-                owner, repo = parsed
-                release = _get_latest_release_for_update(owner, repo)
+                release = releases.get(repos[integration.driver_id])
                 if release:
                     latest_version = release.get("tag_name", "")
                     current_version = integration.version or ""
@@ -3616,6 +3690,7 @@ def save_home_assistant_settings():
         )
 
         settings.save()
+        get_notification_manager().invalidate_settings_cache()
         _LOG.info("Home Assistant notification settings saved")
         return jsonify({"success": True})
     except Exception as e:
@@ -3637,14 +3712,13 @@ def test_home_assistant_notification():
             token=settings.home_assistant.token,
         )
 
-        async def send_test():
-            return await NotificationService.send_home_assistant(
+        success = run_notification_sync(
+            NotificationService.send_home_assistant(
                 test_config,
                 "Integration Manager",
                 "Test notification from Integration Manager",
             )
-
-        success = asyncio.run(send_test())
+        )
 
         if success:
             return jsonify({"success": True})
@@ -3674,6 +3748,7 @@ def save_webhook_settings():
         )
 
         settings.save()
+        get_notification_manager().invalidate_settings_cache()
         _LOG.info("Webhook notification settings saved")
         return jsonify({"success": True})
     except Exception as e:
@@ -3695,15 +3770,14 @@ def test_webhook_notification():
             headers=settings.webhook.headers,
         )
 
-        async def send_test():
-            return await NotificationService.send_webhook(
+        success = run_notification_sync(
+            NotificationService.send_webhook(
                 test_config,
                 "Integration Manager",
                 "Test notification from Integration Manager",
                 {"source": "test"},
             )
-
-        success = asyncio.run(send_test())
+        )
 
         if success:
             return jsonify({"success": True})
@@ -3733,6 +3807,7 @@ def save_pushover_settings():
         )
 
         settings.save()
+        get_notification_manager().invalidate_settings_cache()
         _LOG.info("Pushover notification settings saved")
         return jsonify({"success": True})
     except Exception as e:
@@ -3754,14 +3829,13 @@ def test_pushover_notification():
             app_token=settings.pushover.app_token,
         )
 
-        async def send_test():
-            return await NotificationService.send_pushover(
+        success = run_notification_sync(
+            NotificationService.send_pushover(
                 test_config,
                 "Integration Manager",
                 "Test notification from Integration Manager",
             )
-
-        success = asyncio.run(send_test())
+        )
 
         if success:
             return jsonify({"success": True})
@@ -3792,6 +3866,7 @@ def save_ntfy_settings():
         )
 
         settings.save()
+        get_notification_manager().invalidate_settings_cache()
         _LOG.info("ntfy notification settings saved")
         return jsonify({"success": True})
     except Exception as e:
@@ -3814,15 +3889,14 @@ def test_ntfy_notification():
             token=settings.ntfy.token,
         )
 
-        async def send_test():
-            return await NotificationService.send_ntfy(
+        success = run_notification_sync(
+            NotificationService.send_ntfy(
                 test_config,
                 "Integration Manager",
                 "Test notification from Integration Manager",
                 tags=["white_check_mark"],
             )
-
-        success = asyncio.run(send_test())
+        )
 
         if success:
             return jsonify({"success": True})
@@ -3851,6 +3925,7 @@ def save_discord_settings():
         )
 
         settings.save()
+        get_notification_manager().invalidate_settings_cache()
         _LOG.info("Discord notification settings saved")
         return jsonify({"success": True})
     except Exception as e:
@@ -3871,14 +3946,13 @@ def test_discord_notification():
             webhook_url=settings.discord.webhook_url,
         )
 
-        async def send_test():
-            return await NotificationService.send_discord(
+        success = run_notification_sync(
+            NotificationService.send_discord(
                 test_config,
                 "Integration Manager",
                 "Test notification from Integration Manager",
             )
-
-        success = asyncio.run(send_test())
+        )
 
         if success:
             return jsonify({"success": True})
@@ -3913,6 +3987,7 @@ def save_notification_triggers():
         )
 
         settings.save()
+        get_notification_manager().invalidate_settings_cache()
 
         _LOG.info("Notification trigger preferences saved")
         return jsonify({"success": True})
@@ -4594,6 +4669,7 @@ def upload_complete_backup():
                     )
 
                 notification_settings.save()
+                get_notification_manager().invalidate_settings_cache()
                 _LOG.info("Restored notification settings from backup")
             except Exception as e:
                 _LOG.warning("Failed to restore notification settings: %s", e)
@@ -4949,67 +5025,39 @@ class WebServer:
         except Exception as e:
             _LOG.warning("Failed to check system messages: %s", e)
 
-    def perform_scheduled_backup(self) -> bool:
+    async def perform_scheduled_backup_async(self, client: RemoteAPIClient) -> bool:
         """
-        Perform scheduled backup of all supported integrations.
+        Perform scheduled backup of all supported integrations on the event loop.
+
+        The setup flows run through the async Remote API client, so no worker
+        thread is held for the duration of the backup. The backups are written
+        to the backup file at once.
 
+        :param client: The RemoteAPIClient instance
         :return: True if backup was successful, False otherwise
         """
-        if not _remote_client:
-            _LOG.warning("Cannot perform backup - remote client not initialized")
-            return False
-
         try:
             _LOG.info("Starting scheduled backup of integrations...")
 
-            # Load registry to check which integrations support backup
-            registry = load_registry()
-            registry_by_driver_id = {}
-            for item in registry:
-                if item.get("driver_id"):
-                    registry_by_driver_id[item["driver_id"]] = item
-                registry_by_driver_id[item["id"]] = item
-
-            # Get installed integrations
-            integrations = _remote_client.get_integrations()
-
-            backed_up_count = 0
-            total_attempted = 0
-
-            for instance in integrations:
-                driver_id = instance.get("driver_id", "")
-                version = instance.get("version", "0.0.0")
-
-                # Check if this integration supports backup and meets version requirements
-                reg_item = registry_by_driver_id.get(driver_id)
-                if not reg_item:
-                    continue
-
-                can_backup, reason = _can_backup_integration(
-                    driver_id, version, reg_item
-                )
-                if not can_backup:
-                    continue
-
-                total_attempted += 1
+            # Get installed integrations that support backup
+            integrations = await client.get_integration_instances()
+            registry = await asyncio.to_thread(load_registry)
+            driver_ids = _get_backup_driver_ids(integrations, registry)
 
-                # Try to backup
-                backup_data = backup_integration(
-                    _remote_client, driver_id, save_to_file=True
-                )
-                if backup_data:
-                    backed_up_count += 1
-                    _LOG.debug("Backed up integration: %s", driver_id)
+            store = BackupStore()
+            results = await backup_integrations_async(client, driver_ids, store=store)
+            backed_up_count = sum(1 for data in results.values() if data)
+            if backed_up_count and not await asyncio.to_thread(store.flush):
+                backed_up_count = 0
 
             _LOG.info(
                 "Scheduled backup complete: %d/%d integrations backed up",
                 backed_up_count,
-                total_attempted,
+                len(driver_ids),
             )
 
-            return (
-                backed_up_count > 0 or total_attempted == 0
-            )  # Success if we backed up something or nothing to backup
+            # Success if we backed up something or nothing to backup
+            return backed_up_count > 0 or not driver_ids
 
         except Exception as e:
             _LOG.error("Failed to perform scheduled backup: %s", e)